@@ -1,9 +1,14 @@
 """GavaConnect SDK for Python."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from ._version import __version__
-from .checkers import KRAPINChecker
-from .config import SDKConfig
-from .errors import APIError, RateLimitError, SDKError, TransportError
+
+if TYPE_CHECKING:
+    from .checkers import KRAPINChecker
+    from .config import SDKConfig
+    from .errors import APIError, RateLimitError, SDKError, TransportError
 
 __all__ = [
     "__version__",
@@ -14,3 +19,37 @@ __all__ = [
     "TransportError",
     "KRAPINChecker",
 ]
+
+# Submodule for each exported name; resolved on first access (PEP 562) to
+# keep `import gavaconnect` itself as light as possible.
+_LAZY = {
+    "SDKConfig": ".config",
+    "SDKError": ".errors",
+    "APIError": ".errors",
+    "RateLimitError": ".errors",
+    "TransportError": ".errors",
+    "KRAPINChecker": ".checkers",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Resolve exported names lazily on first attribute access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The resolved class.
+
+    Raises:
+        AttributeError: If the name is not exported by this module.
+
+    """
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
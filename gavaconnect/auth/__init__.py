@@ -1,8 +1,16 @@
 """Authentication module for GavaConnect SDK."""
 
-from .basic import BasicAuthPolicy, BasicCredentials
-from .bearer import AuthPolicy, BearerAuthPolicy, TokenProvider
-from .providers import ClientCredentialsProvider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .basic import BasicAuthPolicy, BasicCredentials
+    from .bearer import AuthPolicy, BearerAuthPolicy, TokenProvider
+    from .providers import (
+        ClientCredentialsProvider,
+        close_shared_client,
+        shared_client_credentials_provider,
+    )
 
 __all__ = [
     "AuthPolicy",
@@ -11,4 +19,42 @@ __all__ = [
     "BearerAuthPolicy",
     "TokenProvider",
     "ClientCredentialsProvider",
+    "close_shared_client",
+    "shared_client_credentials_provider",
 ]
+
+# Submodule for each exported name; resolved on first access (PEP 562) so
+# importing this package does not pull in httpx until auth is actually used.
+_LAZY = {
+    "AuthPolicy": ".bearer",
+    "BasicAuthPolicy": ".basic",
+    "BasicCredentials": ".basic",
+    "BearerAuthPolicy": ".bearer",
+    "TokenProvider": ".bearer",
+    "ClientCredentialsProvider": ".providers",
+    "close_shared_client": ".providers",
+    "shared_client_credentials_provider": ".providers",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Resolve exported names lazily on first attribute access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The resolved class or function.
+
+    Raises:
+        AttributeError: If the name is not exported by this module.
+
+    """
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
@@ -19,6 +19,19 @@ class AuthPolicy(Protocol):
         """
         ...
 
+    def authorize_inplace(self, request: httpx.Request) -> None:
+        """Stamp cached credentials onto an existing request.
+
+        Fast path for the 401 retry right after on_unauthorized() has
+        refreshed credentials; the transport treats it as optional and
+        falls back to authorize() when a policy does not provide it.
+
+        Args:
+            request: The HTTP request to re-authorize.
+
+        """
+        ...
+
     async def on_unauthorized(self) -> bool:
         """Handle unauthorized response.
 
@@ -50,6 +63,18 @@ class TokenProvider(Protocol):
         """
         ...
 
+    def is_expired(self) -> bool:
+        """Report whether the cached token is past its expiry deadline.
+
+        Judged against the provider's own clock, so providers with an
+        injected clock never disagree with callers about the timebase.
+
+        Returns:
+            True when the token should be refreshed before use.
+
+        """
+        return False
+
 
 class BearerAuthPolicy:
     """Bearer token authentication policy."""
@@ -62,17 +87,41 @@ class BearerAuthPolicy:
 
         """
         self._p, self._last = provider, ""
+        self._header = ""
 
     async def authorize(self, request: httpx.Request) -> None:
         """Add bearer token to the request.
 
+        Refreshes proactively when the provider reports the token as past
+        its expiry deadline, skipping the 401 round trip.
+
         Args:
             request: The HTTP request to authorize.
 
         """
-        token = await self._p.get_token()
-        self._last = token
-        request.headers["authorization"] = f"Bearer {token}"
+        is_expired = getattr(self._p, "is_expired", None)
+        if is_expired is not None and is_expired():
+            token = await self._p.refresh()
+        else:
+            token = await self._p.get_token()
+        if token is not self._last:
+            # Providers hand back the same cached str between refreshes, so
+            # the header only needs re-formatting when the token rotates.
+            self._last = token
+            self._header = f"Bearer {token}"
+        request.headers["authorization"] = self._header
+
+    def authorize_inplace(self, request: httpx.Request) -> None:
+        """Stamp the cached bearer header onto an existing request.
+
+        Used on the 401-retry path right after on_unauthorized() has
+        refreshed the token, so no provider round trip is needed.
+
+        Args:
+            request: The HTTP request to re-authorize.
+
+        """
+        request.headers["authorization"] = self._header
 
     async def on_unauthorized(self) -> bool:
         """Handle unauthorized response by refreshing the token.
@@ -84,4 +133,5 @@ class BearerAuthPolicy:
         new_token = await self._p.refresh()
         changed = new_token != self._last
         self._last = new_token
+        self._header = f"Bearer {new_token}"
         return changed
@@ -1,10 +1,51 @@
 """Token provider implementations for GavaConnect SDK."""
 
 import asyncio
+import base64
 import time
+from collections.abc import Callable
+from urllib.parse import urlencode
 
 import httpx
 
+try:  # orjson parses token responses faster when installed
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    from json import loads as _loads
+
+# Bound once so hot-path expiry checks skip the time-module attribute lookup.
+_now = time.monotonic
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Return the lazily-created client shared by all token providers.
+
+    A single pooled client keeps TLS sessions and HTTP/2 streams alive
+    across providers instead of every instance opening its own pool.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+            timeout=10,
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared token-endpoint client, if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 class ClientCredentialsProvider:
     """OAuth2 client credentials token provider."""
@@ -16,7 +57,9 @@ class ClientCredentialsProvider:
         client_secret: str,
         scope: str | None = None,
         early_refresh_s: int = 60,
+        stale_window_s: int = 180,
         client: httpx.AsyncClient | None = None,
+        clock: Callable[[], float] | None = None,
     ) -> None:
         """Initialize the client credentials provider.
 
@@ -26,7 +69,11 @@ class ClientCredentialsProvider:
             client_secret: OAuth2 client secret.
             scope: Optional scope for the token.
             early_refresh_s: Seconds before expiry to refresh token.
+            stale_window_s: Window before expiry in which the cached token
+                is still served while a background refresh runs.
             client: Optional HTTP client to use.
+            clock: Monotonic time source; tests inject a fake instead of
+                patching the module clock globally.
 
         """
         self._url, self._cid, self._sec, self._scope = (
@@ -37,46 +84,176 @@ class ClientCredentialsProvider:
         )
         self._early, self._client = (
             early_refresh_s,
-            (client or httpx.AsyncClient(timeout=10)),
+            (client or _get_shared_client()),
+        )
+        self._basic_header = (
+            "Basic "
+            + base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
         )
+        # The token request never changes for a given provider; encode the
+        # form body and headers once instead of per refresh.
+        data = {"grant_type": "client_credentials"}
+        if scope:
+            data["scope"] = scope
+        self._body_bytes = urlencode(data).encode()
+        self._post_headers = {
+            "authorization": self._basic_header,
+            "content-type": "application/x-www-form-urlencoded",
+        }
+        self._stale = stale_window_s
+        self._clock = clock or _now
         self._lock = asyncio.Lock()
+        self._inflight: asyncio.Future[tuple[str, float]] | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
         self._token, self._exp = "", 0.0
+        # Precomputed when a token lands so the hot path is two compares.
+        self._stale_at = 0.0
 
     async def _fetch(self) -> tuple[str, float]:
-        data = {"grant_type": "client_credentials"} | (
-            {"scope": self._scope} if self._scope else {}
-        )
-        r = await self._client.post(
+        req = httpx.Request(
+            "POST",
             self._url,
-            auth=(self._cid, self._sec),
-            data=data,
-            headers={"content-type": "application/x-www-form-urlencoded"},
+            headers=self._post_headers,
+            content=self._body_bytes,
         )
+        r = await self._client.send(req)
         r.raise_for_status()
-        p = r.json()
+        p = _loads(r.content)
         ttl = float(p.get("expires_in", 3600))
-        return p["access_token"], time.time() + max(30.0, ttl - self._early)
+        return p["access_token"], self._clock() + max(30.0, ttl - self._early)
+
+    def is_expired(self) -> bool:
+        """Report whether the cached token is past its expiry deadline.
+
+        Compared on the provider's injected clock, never the module clock,
+        so callers and the provider share one timebase.
+
+        Returns:
+            True once the clock passes the deadline computed at fetch time;
+            False before the first fetch, when get_token fetches anyway.
+
+        """
+        return bool(self._token) and self._clock() >= self._exp
+
+    async def _refresh_coalesced(self) -> str:
+        """Fetch a new token, coalescing concurrent refreshes into one call.
+
+        The first caller becomes the leader and performs the fetch; every
+        concurrent caller awaits the same in-flight Future, so N simultaneous
+        refreshes collapse into a single HTTP request.
+        """
+        fut: asyncio.Future[tuple[str, float]]
+        async with self._lock:
+            if self._inflight is None:
+                fut = asyncio.get_running_loop().create_future()
+                self._inflight = fut
+                leader = True
+            else:
+                fut = self._inflight
+                leader = False
+        if leader:
+            try:
+                result = await self._fetch()
+            except Exception as e:
+                fut.set_exception(e)
+            else:
+                self._token, self._exp = result
+                self._stale_at = self._exp - self._stale
+                fut.set_result(result)
+            finally:
+                self._inflight = None
+                if not fut.done():
+                    # The leader was cancelled mid-fetch; cancel the shared
+                    # future too so coalesced waiters wake instead of
+                    # awaiting a future nobody will ever resolve.
+                    fut.cancel()
+        token, _ = await fut
+        return token
+
+    async def _background_refresh(self) -> None:
+        """Run a coalesced refresh off the caller's critical path."""
+        try:
+            await self._refresh_coalesced()
+        except Exception:  # noqa: S110 - cached token is still valid
+            # Callers keep the stale-but-valid token; a failure here is
+            # retried on the next stale read or surfaced once expired.
+            pass
 
     async def get_token(self) -> str:
         """Get the current access token, refreshing if necessary.
 
+        Tokens move through three states: fresh reads are lock-free and
+        return immediately; stale reads (inside ``stale_window_s`` of
+        expiry) return the still-valid cached token while a background
+        task refreshes it; only a truly expired token blocks the caller
+        on a single coalesced refresh.
+
         Returns:
             The access token.
 
         """
-        async with self._lock:
-            if self._token and time.time() < self._exp:
-                return self._token
-            self._token, self._exp = await self._fetch()
+        now = self._clock()
+        if self._token and now < self._exp:
+            if now >= self._stale_at and (
+                self._refresh_task is None or self._refresh_task.done()
+            ):
+                self._refresh_task = asyncio.create_task(self._background_refresh())
             return self._token
+        return await self._refresh_coalesced()
 
     async def refresh(self) -> str:
         """Force refresh the access token.
 
+        Joins an in-flight refresh if one is already running, since that
+        will produce a brand-new token anyway.
+
         Returns:
             The new access token.
 
         """
-        async with self._lock:
-            self._token, self._exp = await self._fetch()
-            return self._token
+        return await self._refresh_coalesced()
+
+
+_PROVIDER_CACHE: dict[tuple[str, str], ClientCredentialsProvider] = {}
+
+
+def shared_client_credentials_provider(
+    token_url: str,
+    client_id: str,
+    client_secret: str,
+    scope: str | None = None,
+    early_refresh_s: int = 60,
+) -> ClientCredentialsProvider:
+    """Return a provider shared by every caller with the same credentials.
+
+    Cached by ``(token_url, client_id)`` so resource clients that share
+    credentials also share one token cache and one refresh flow instead of
+    each acquiring its own token. A different ``client_secret`` for a
+    cached key means the credentials were rotated, so the provider is
+    rebuilt rather than left fetching tokens with the stale secret.
+    Construction is synchronous, so the plain dict check cannot race on a
+    single event loop.
+
+    Args:
+        token_url: OAuth2 token endpoint URL.
+        client_id: OAuth2 client ID.
+        client_secret: OAuth2 client secret.
+        scope: Optional scope, used only when the provider is (re)built.
+        early_refresh_s: Early-refresh window, used only on (re)build.
+
+    Returns:
+        The cached, rebuilt, or newly constructed provider.
+
+    """
+    key = (token_url, client_id)
+    provider = _PROVIDER_CACHE.get(key)
+    if provider is None or provider._sec != client_secret:
+        provider = ClientCredentialsProvider(
+            token_url,
+            client_id,
+            client_secret,
+            scope=scope,
+            early_refresh_s=early_refresh_s,
+        )
+        _PROVIDER_CACHE[key] = provider
+    return provider
@@ -5,6 +5,21 @@ class KRAPINChecker:
         self.id_number = id_number
 
     def check_by_id_number(self) -> str:
-        if len(self.id_number) == 6:
+        pin = self.id_number
+        # Plain C-level str checks; no regex state machine needed for 6 chars.
+        if len(pin) == 6 and pin.isascii() and pin.isalnum():
             return "Valid KRA PIN."
         return "Invalid KRA PIN."
+
+    @classmethod
+    def check_many(cls, id_numbers: list[str]) -> list[str]:
+        """Check a batch of id numbers in one call.
+
+        Args:
+            id_numbers: The id numbers to check.
+
+        Returns:
+            One result string per input, in order.
+
+        """
+        return [cls(i).check_by_id_number() for i in id_numbers]
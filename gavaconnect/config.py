@@ -1,21 +1,32 @@
 """Configuration classes for the GavaConnect SDK."""
 
-from dataclasses import dataclass, field
+from collections.abc import Collection
+from dataclasses import dataclass
 
 from ._version import __version__
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RetryPolicy:
     """Configuration for retry behavior."""
 
     max_attempts: int = 3
     base_backoff_s: float = 0.2
     max_cap_s: float = 60.0  # Maximum cap for backoff delay
-    retry_on_status: tuple[int, ...] = (429, 500, 502, 503, 504)
+    # Callers may pass any collection; coerced to frozenset in __post_init__.
+    retry_on_status: Collection[int] = frozenset({429, 500, 502, 503, 504})
 
+    def __post_init__(self) -> None:
+        """Coerce retry_on_status to a frozenset for O(1) membership tests."""
+        if not isinstance(self.retry_on_status, frozenset):
+            object.__setattr__(self, "retry_on_status", frozenset(self.retry_on_status))
 
-@dataclass(slots=True)
+
+# Immutable, so one default instance can back every SDKConfig.
+_DEFAULT_RETRY = RetryPolicy()
+
+
+@dataclass(slots=True, frozen=True)
 class SDKConfig:
     """Main configuration for the GavaConnect SDK."""
 
@@ -23,5 +34,10 @@ class SDKConfig:
     connect_timeout_s: float = 5.0
     read_timeout_s: float = 30.0
     total_timeout_s: float = 40.0
-    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    retry: RetryPolicy = _DEFAULT_RETRY
     user_agent: str = f"gavaconnect-py/{__version__}"
+    # Connection-pool sizing. HTTP/2 multiplexes many streams per
+    # connection, so a handful of keepalive connections serves highly
+    # concurrent call patterns (e.g. batch PIN validation).
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from gavaconnect.helpers.idempotency import _parse_retry_after
+
 
 class SDKError(Exception):
     """Base exception for all SDK errors."""
@@ -18,25 +20,78 @@ class SerializationError(SDKError):
 class APIError(SDKError):
     """Exception raised for API-related errors."""
 
+    __slots__ = (
+        "status",
+        "type",
+        "code",
+        "request_id",
+        "_retry_after_s",
+        "_retry_after_raw",
+        "body",
+    )
+
     def __init__(
         self,
         status: int,
         type_: str,
         message: str,
-        code: str | None,
-        request_id: str | None,
-        retry_after_s: float | None,
-        body: bytes | None,
+        code: str | None = None,
+        request_id: str | None = None,
+        retry_after_s: float | None = None,
+        body: bytes | None = None,
+        *,
+        retry_after_raw: str | None = None,
     ) -> None:
-        """Initialize APIError with response details."""
+        """Initialize APIError with response details.
+
+        ``retry_after_raw`` takes the unparsed Retry-After header value;
+        it is only parsed if ``retry_after_s`` is actually read, so errors
+        the retry loop never consults skip the parse entirely.
+        """
         super().__init__(message)
         self.status = status
         self.type = type_
         self.code = code
         self.request_id = request_id
-        self.retry_after_s = retry_after_s
+        self._retry_after_s = retry_after_s
+        self._retry_after_raw = None if retry_after_s is not None else retry_after_raw
         self.body = body
 
+    @property
+    def retry_after_s(self) -> float | None:
+        """Seconds to wait before retrying, lazily parsed on first access."""
+        if self._retry_after_s is None and self._retry_after_raw is not None:
+            self._retry_after_s = _parse_retry_after(self._retry_after_raw)
+            self._retry_after_raw = None
+        return self._retry_after_s
+
 
 class RateLimitError(APIError):
     """Exception raised when API rate limits are exceeded."""
+
+    __slots__ = ()
+
+
+# Precomputed at import time: classifying a caught exception is then one
+# frozenset hash probe instead of an MRO walk per isinstance/issubclass.
+_API_ERROR_TYPES = frozenset({APIError, RateLimitError})
+_SDK_ERROR_TYPES = frozenset(
+    {SDKError, TransportError, SerializationError, APIError, RateLimitError}
+)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True when the exception represents a safely retryable failure.
+
+    Transport failures and rate limits are transient; other SDK errors
+    (and anything outside the SDK hierarchy) are not worth re-sending.
+    Subclasses of the retryable types classify like their parents.
+
+    Args:
+        exc: The caught exception to classify.
+
+    Returns:
+        True if callers may retry the originating request.
+
+    """
+    return isinstance(exc, (TransportError, RateLimitError))
@@ -1,26 +1,34 @@
 """Idempotency utilities for ensuring request uniqueness."""
 
 import datetime
-import uuid
+import secrets
 from email.utils import parsedate_to_datetime
-from random import SystemRandom
+from functools import lru_cache
+from random import Random
 
 import httpx
 
-_rng = SystemRandom()  # cryptographically strong; avoids Bandit B311
+# Rebindable indirection so tests can inject a fake HTTP-date parser
+# without mock.patch machinery.
+_parsedate = parsedate_to_datetime
+
+# Backoff jitter is not security-sensitive; a seeded PRNG avoids a urandom
+# syscall per retry.
+_rng = Random()  # noqa: S311 - non-crypto jitter
 
 
 def idempotency_headers(key: str | None = None) -> dict[str, str]:
     """Generate idempotency headers for HTTP requests.
 
     Args:
-        key: Optional idempotency key. If None, a UUID4 will be generated.
+        key: Optional idempotency key. If None, a random 128-bit hex key
+            is generated (token_hex skips UUID object construction).
 
     Returns:
         A dictionary containing the idempotency-key header.
 
     """
-    return {"idempotency-key": key or str(uuid.uuid4())}
+    return {"idempotency-key": key or secrets.token_hex(16)}
 
 
 def _full_jitter(base: float, attempt: int, cap: float) -> float:
@@ -29,35 +37,52 @@ def _full_jitter(base: float, attempt: int, cap: float) -> float:
     return _rng.uniform(0.0, max_sleep)
 
 
+@lru_cache(maxsize=256)
+def _retry_after_numeric(value: str) -> float | None:
+    """Parse a numeric Retry-After value, cached since servers reuse a few."""
+    # hot path: plain integer seconds, no exception machinery
+    if value.isdigit():
+        return float(value)
+    # signed/fractional numeric forms
+    try:
+        secs = float(value)
+    except ValueError:
+        return None
+    return secs if secs >= 0 else None
+
+
 def _parse_retry_after(value: str | None) -> float | None:
     """Return seconds to wait from Retry-After which may be seconds or HTTP-date."""
     if not value:
         return None
-    # numeric seconds
-    try:
-        secs = float(value)
-        if secs >= 0:
-            return secs
-    except ValueError:
-        pass
-    # HTTP-date
+    secs = _retry_after_numeric(value)
+    if secs is not None:
+        return secs
+    # HTTP-date: time-dependent, so deliberately never cached
     try:
-        dt = parsedate_to_datetime(value)
+        dt = _parsedate(value)
         if dt is not None:
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=datetime.UTC)
-            delta = (dt - datetime.datetime.now(datetime.UTC)).total_seconds()
-            return max(0.0, delta)
+            now = datetime.datetime.now(datetime.UTC)
+            return max(0.0, (dt - now).total_seconds())
     except Exception:
         return None
 
 
+# Both spellings pre-listed so the common all-caps/all-lower probes never
+# pay for a str.upper() allocation.
+_IDEMPOTENT = frozenset(
+    ("GET", "HEAD", "OPTIONS", "DELETE", "get", "head", "options", "delete")
+)
+
+
 def _is_idempotent(method: str) -> bool:
-    return method.upper() in {"GET", "HEAD", "OPTIONS", "DELETE"}
+    return method in _IDEMPOTENT or method.upper() in _IDEMPOTENT
 
 
 def _can_retry(method: str, req: httpx.Request) -> bool:
-    # Allow retries for idempotent methods, or if caller provides Idempotency-Key for writes.
-    return _is_idempotent(method) or (
-        "idempotency-key" in (k.lower() for k in req.headers.keys())
-    )
+    # Allow retries for idempotent methods, or if caller provides Idempotency-Key
+    # for writes. Only req.headers is read, and httpx.Headers membership is
+    # already case-insensitive.
+    return _is_idempotent(method) or "idempotency-key" in req.headers
@@ -16,9 +16,11 @@ async def log_request(req: httpx.Request) -> None:
 
     """
     req.extensions["start_time"] = time.perf_counter()
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     hdrs = dict(req.headers)
     hdrs.pop("authorization", None)
-    logger.debug(f"HTTP {req.method} {req.url} headers={hdrs}")
+    logger.debug("HTTP %s %s headers=%s", req.method, req.url, hdrs)
 
 
 async def log_response(req: httpx.Request, resp: httpx.Response) -> None:
@@ -29,7 +31,18 @@ async def log_response(req: httpx.Request, resp: httpx.Response) -> None:
         resp: The HTTP response to log.
 
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     dur = time.perf_counter() - req.extensions.get("start_time", time.perf_counter())
+    rid = resp.headers.get("x-request-id")
+    # Lazy %-formatting defers string building to the handler; the extra
+    # fields let structured handlers (and tests) read values numerically.
     logger.info(
-        f"HTTP {req.method} {req.url} -> {resp.status_code} in {dur:.3f}s request_id={resp.headers.get('x-request-id')}"
+        "HTTP %s %s -> %d in %.3fs request_id=%s",
+        req.method,
+        req.url,
+        resp.status_code,
+        dur,
+        rid,
+        extra={"request_id": rid, "duration_s": dur},
     )
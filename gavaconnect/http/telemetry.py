@@ -1,36 +1,219 @@
 """OpenTelemetry tracing utilities for HTTP requests."""
 
+import logging
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
 import httpx
-from opentelemetry import trace
 
-tracer = trace.get_tracer("gavaconnect")
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
+
+logger = logging.getLogger("gavaconnect.telemetry")
+
+# Module-level so tests can monkeypatch it; None when OTel is missing.
+tracer: "Tracer | None"
+
+# Spans live in a weak side table rather than request.extensions, so the
+# untraced path never touches the extensions dict and finished requests
+# are cleaned up by GC.
+_spans: WeakKeyDictionary[httpx.Request, Any] = WeakKeyDictionary()
+
+try:
+    from opentelemetry import trace
+
+    OTEL_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without the extra
+    OTEL_AVAILABLE = False
+
+if OTEL_AVAILABLE:
+    tracer = trace.get_tracer("gavaconnect")
+
+    def _tracing_enabled() -> bool:
+        """Return True when a real (non-noop) tracer provider is configured.
+
+        Returns:
+            False for the default proxy/no-op providers, True otherwise.
+
+        """
+        provider = trace.get_tracer_provider()
+        return not isinstance(
+            provider, (trace.ProxyTracerProvider, trace.NoOpTracerProvider)
+        )
+
+    def otel_request_span(req: httpx.Request) -> None:
+        """Start an OpenTelemetry span for an HTTP request.
+
+        Returns immediately when tracing is not configured, before any
+        attribute dict or span object is allocated.
+
+        Args:
+            req: The HTTP request to trace.
+
+        """
+        if tracer is None or not _tracing_enabled():
+            return
+        # Pre-split attributes from the parsed URL; str(req.url) would
+        # reassemble the whole URL per span.
+        span = tracer.start_span(
+            "http.client",
+            attributes={
+                "http.method": req.method,
+                "net.peer.name": req.url.host,
+                "http.target": req.url.raw_path.decode("ascii", "replace"),
+            },
+        )
+        _spans[req] = span
+
+    def otel_response_span(req: httpx.Request, resp: httpx.Response) -> None:
+        """Complete an OpenTelemetry span for an HTTP response.
+
+        Args:
+            req: The HTTP request.
+            resp: The HTTP response.
+
+        """
+        span = _spans.pop(req, None)
+        if span:
+            span.set_attribute("http.status_code", resp.status_code)
+            rid = resp.headers.get("x-request-id")
+            if rid:
+                span.set_attribute("http.response.request_id", rid)
+            span.end()
+
+    def configure_tracing(
+        endpoint: str | None = None,
+        *,
+        exporter: Any | None = None,  # noqa: ANN401 - SpanExporter, SDK optional
+        sample_ratio: float = 0.01,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 256,
+        schedule_delay_millis: int = 5000,
+    ) -> None:
+        """Install a sampled tracer provider with a BatchSpanProcessor.
+
+        SimpleSpanProcessor exports on the caller's critical path; the
+        batch processor only appends to an in-memory queue per span, so
+        this is the setup production users should call once at startup.
+        It must run before any other tracer provider is installed: the
+        OpenTelemetry API never replaces a set provider, so a later call
+        logs a warning and returns without effect.
+
+        Args:
+            endpoint: OTLP endpoint used to build the default exporter.
+            exporter: Pre-built span exporter; overrides ``endpoint``.
+            sample_ratio: Parent-based trace-id ratio to sample at.
+            max_queue_size: Batch processor queue size.
+            max_export_batch_size: Spans exported per batch.
+            schedule_delay_millis: Delay between batch exports.
+
+        Raises:
+            ImportError: If the OpenTelemetry SDK or OTLP exporter is
+                not installed.
+            ValueError: If neither ``endpoint`` nor ``exporter`` is given.
+
+        """
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            SimpleSpanProcessor,
+        )
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        if exporter is None and endpoint is None:
+            msg = "configure_tracing requires an endpoint or an exporter"
+            raise ValueError(msg)
+
+        current = trace.get_tracer_provider()
+        if not isinstance(current, trace.ProxyTracerProvider):
+            # set_tracer_provider silently refuses to overwrite a provider
+            # that is already installed, so surface the no-op instead of
+            # promising a replacement that never happens.
+            active = getattr(current, "_active_span_processor", None)
+            simple = any(
+                isinstance(p, SimpleSpanProcessor)
+                for p in getattr(active, "_span_processors", ())
+            )
+            logger.warning(
+                "A tracer provider is already installed and the OpenTelemetry "
+                "API will not replace it; this configure_tracing call has no "
+                "effect.%s",
+                " The existing SimpleSpanProcessor keeps span export on the "
+                "request path."
+                if simple
+                else "",
+            )
+            return
+
+        if exporter is None:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+
+            exporter = OTLPSpanExporter(endpoint=endpoint, compression="gzip")
+
+        provider = TracerProvider(
+            sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+            resource=Resource.create({"service.name": "gavaconnect"}),
+        )
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                exporter,
+                max_queue_size=max_queue_size,
+                max_export_batch_size=max_export_batch_size,
+                schedule_delay_millis=schedule_delay_millis,
+            )
+        )
+        trace.set_tracer_provider(provider)
+
+else:  # pragma: no cover - exercised only without the extra
+    tracer = None
+
+    # Bound at import time so the per-request hot path is a bare no-op call
+    # with no availability checks.
+    def otel_request_span(req: httpx.Request) -> None:
+        """No-op request hook used when OpenTelemetry is not installed.
+
+        Args:
+            req: The HTTP request (ignored).
+
+        """
 
+    def otel_response_span(req: httpx.Request, resp: httpx.Response) -> None:
+        """No-op response hook used when OpenTelemetry is not installed.
 
-async def otel_request_span(req: httpx.Request) -> None:
-    """Start an OpenTelemetry span for an HTTP request.
+        Args:
+            req: The HTTP request (ignored).
+            resp: The HTTP response (ignored).
 
-    Args:
-        req: The HTTP request to trace.
+        """
 
-    """
-    span = tracer.start_span(
-        "http.client", attributes={"http.method": req.method, "http.url": str(req.url)}
-    )
-    req.extensions["otel_span"] = span
+    def configure_tracing(
+        endpoint: str | None = None,
+        *,
+        exporter: Any | None = None,  # noqa: ANN401 - SpanExporter, SDK optional
+        sample_ratio: float = 0.01,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 256,
+        schedule_delay_millis: int = 5000,
+    ) -> None:
+        """Fail fast when OpenTelemetry is not installed.
 
+        Mirrors the real signature so the two variants type-check as one
+        function; every argument is ignored.
 
-async def otel_response_span(req: httpx.Request, resp: httpx.Response) -> None:
-    """Complete an OpenTelemetry span for an HTTP response.
+        Args:
+            endpoint: Ignored.
+            exporter: Ignored.
+            sample_ratio: Ignored.
+            max_queue_size: Ignored.
+            max_export_batch_size: Ignored.
+            schedule_delay_millis: Ignored.
 
-    Args:
-        req: The HTTP request.
-        resp: The HTTP response.
+        Raises:
+            ImportError: Always; tracing needs the opentelemetry packages.
 
-    """
-    span = req.extensions.pop("otel_span", None)
-    if span:
-        span.set_attribute("http.status_code", resp.status_code)
-        rid = resp.headers.get("x-request-id")
-        if rid:
-            span.set_attribute("http.response.request_id", rid)
-        span.end()
+        """
+        msg = "configure_tracing requires the opentelemetry-sdk package"
+        raise ImportError(msg)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import random
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -15,12 +18,34 @@ from gavaconnect.config import SDKConfig
 from gavaconnect.errors import APIError, RateLimitError, TransportError
 from gavaconnect.helpers.idempotency import _can_retry, _full_jitter, _parse_retry_after
 
-RequestHook = Callable[[httpx.Request], Awaitable[None]]
-ResponseHook = Callable[[httpx.Request, httpx.Response], Awaitable[None]]
-_rng = random.SystemRandom()
+try:  # orjson parses several times faster than stdlib json when installed
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    _loads = json.loads
+
+# Hooks may be plain callables or coroutine functions; sync hooks avoid the
+# per-call coroutine allocation entirely.
+RequestHook = Callable[[httpx.Request], Awaitable[None] | None]
+ResponseHook = Callable[[httpx.Request, httpx.Response], Awaitable[None] | None]
+# Jitter only has to break thundering-herd alignment, so a cheap seeded
+# PRNG beats paying a urandom syscall per retry.
+_rng = random.Random()  # noqa: S311 - non-crypto jitter
+_rand = _rng.random
 logger = logging.getLogger("gavaconnect.transport")
 
 
+@lru_cache(maxsize=32)
+def _build_timeout(total_s: float, connect_s: float, read_s: float) -> httpx.Timeout:
+    """Return a shared httpx.Timeout for the given limits.
+
+    Timeouts are immutable, so transports built from equal configs reuse
+    one instance instead of each allocating their own.
+    """
+    return httpx.Timeout(total_s, connect=connect_s, read=read_s)
+
+
 class AsyncTransport:
     """Shared HTTP transport with advanced features.
 
@@ -31,6 +56,10 @@ class AsyncTransport:
     - single 401 → auth.on_unauthorized() → retry once
     """
 
+    # Backoff sleep hook; tests substitute an AsyncMock on the instance
+    # instead of patching the global asyncio.sleep.
+    _sleep = staticmethod(asyncio.sleep)
+
     def __init__(
         self,
         cfg: SDKConfig,
@@ -49,14 +78,20 @@ class AsyncTransport:
         self.cfg = cfg
         self._on_request = on_request or []
         self._on_response = on_response or []
+        self._default_headers = MappingProxyType(
+            {"user-agent": cfg.user_agent, "x-client-version": cfg.user_agent}
+        )
+        self._timeout = _build_timeout(
+            cfg.total_timeout_s, cfg.connect_timeout_s, cfg.read_timeout_s
+        )
         self.client = httpx.AsyncClient(
             base_url=cfg.base_url,
             http2=True,
-            headers={"user-agent": cfg.user_agent, "x-client-version": cfg.user_agent},
-            timeout=httpx.Timeout(
-                cfg.total_timeout_s,
-                connect=cfg.connect_timeout_s,
-                read=cfg.read_timeout_s,
+            headers=self._default_headers,
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=cfg.max_connections,
+                max_keepalive_connections=cfg.max_keepalive_connections,
             ),
         )
 
@@ -64,6 +99,63 @@ class AsyncTransport:
         """Close the HTTP client connection."""
         await self.client.aclose()
 
+    async def _run_request_hooks(
+        self, req: httpx.Request, *, retry: bool = False
+    ) -> None:
+        """Run request hooks; failures are logged, never raised.
+
+        Sync hooks run inline; coroutine results are awaited concurrently,
+        so independent async hooks overlap instead of serializing. Hooks
+        must therefore not depend on each other's side effects.
+
+        Args:
+            req: The request being processed.
+            retry: Whether this is a retried request (affects log wording).
+
+        """
+        msg = (
+            "Request hook failed during retry: %s"
+            if retry
+            else "Request hook failed: %s"
+        )
+        pending: list[Awaitable[None]] = []
+        for req_hook in self._on_request:
+            try:
+                res = req_hook(req)
+            except Exception as e:
+                logger.debug(msg, e, exc_info=True)
+                continue
+            if res is not None:
+                pending.append(res)
+        if pending:
+            for r in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(r, BaseException):
+                    logger.debug(msg, r, exc_info=r)
+
+    async def _run_response_hooks(
+        self, req: httpx.Request, resp: httpx.Response
+    ) -> None:
+        """Run response hooks; failures are logged, never raised.
+
+        Args:
+            req: The request that produced the response.
+            resp: The response being processed.
+
+        """
+        pending: list[Awaitable[None]] = []
+        for resp_hook in self._on_response:
+            try:
+                res = resp_hook(req, resp)
+            except Exception as e:
+                logger.debug("Response hook failed: %s", e, exc_info=True)
+                continue
+            if res is not None:
+                pending.append(res)
+        if pending:
+            for r in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(r, BaseException):
+                    logger.debug("Response hook failed: %s", r, exc_info=r)
+
     async def request(
         self,
         method: str,
@@ -88,6 +180,31 @@ class AsyncTransport:
         """
         attempt = 1
         did_refresh = False
+        # Pre-encode JSON bodies once (mirroring httpx's wire format) so
+        # retries never re-serialize the payload.
+        if "json" in kw:
+            kw["content"] = json.dumps(
+                kw.pop("json"),
+                ensure_ascii=False,
+                separators=(",", ":"),
+                allow_nan=False,
+            ).encode()
+            headers = dict(kw.get("headers") or {})
+            if not any(k.lower() == "content-type" for k in headers):
+                headers["content-type"] = "application/json"
+            kw["headers"] = headers
+        # A request with a repeatable (bytes/str) body can be re-sent as-is;
+        # streaming/file bodies must be rebuilt per attempt for safety.
+        reuse_request = (
+            "files" not in kw
+            and "data" not in kw
+            and isinstance(kw.get("content", b""), bytes | str)
+        )
+        retry = self.cfg.retry
+        max_attempts = retry.max_attempts
+        base_backoff_s = retry.base_backoff_s
+        max_cap_s = retry.max_cap_s
+        retry_statuses = retry.retry_on_status
 
         # Always rebuild the request each loop to avoid reusing consumed bodies.
         def build() -> httpx.Request:
@@ -98,38 +215,30 @@ class AsyncTransport:
         req = build()
         if auth:
             await auth.authorize(req)
-        for req_hook in self._on_request:
-            try:
-                await req_hook(req)
-            except Exception as e:
-                # Hooks must not break transport; swallow but continue.
-                logger.debug("Request hook failed: %s", e, exc_info=True)
-                pass
+        if self._on_request:
+            await self._run_request_hooks(req)
 
         while True:
             try:
                 resp = await self.client.send(req, stream=False)
             except httpx.HTTPError as e:
                 # Network/protocol error
-                if attempt > self.cfg.retry.max_attempts or not _can_retry(method, req):
+                if attempt > max_attempts or not _can_retry(method, req):
                     raise TransportError(str(e)) from e
-                delay = _full_jitter(
-                    self.cfg.retry.base_backoff_s, attempt, self.cfg.retry.max_cap_s
-                )
-                await asyncio.sleep(delay)
+                delay = _full_jitter(base_backoff_s, attempt, max_cap_s)
+                await self._sleep(delay)
                 attempt += 1
-                req = build()
+                if reuse_request:
+                    req.extensions["attempt"] = attempt
+                else:
+                    req = build()
                 if auth:
                     await auth.authorize(req)
                 continue
 
             # Run response hooks (even if we'll retry) so logs/metrics capture all attempts.
-            for resp_hook in self._on_response:
-                try:
-                    await resp_hook(req, resp)
-                except Exception as e:
-                    logger.debug("Response hook failed: %s", e, exc_info=True)
-                    pass
+            if self._on_response:
+                await self._run_response_hooks(req, resp)
 
             # 401 handling: give auth one chance to refresh and retry once.
             if resp.status_code == 401 and auth and not did_refresh:
@@ -140,52 +249,49 @@ class AsyncTransport:
                 if refreshed:
                     did_refresh = True
                     attempt += 1
-                    req = build()
-                    await auth.authorize(req)
+                    # on_unauthorized() already refreshed the token, so a
+                    # policy exposing authorize_inplace can restamp the
+                    # header on the existing request without another
+                    # provider await or request rebuild.
+                    inplace = getattr(auth, "authorize_inplace", None)
+                    if reuse_request:
+                        req.extensions["attempt"] = attempt
+                        if inplace is not None:
+                            inplace(req)
+                        else:
+                            await auth.authorize(req)
+                    else:
+                        req = build()
+                        await auth.authorize(req)
                     # Optional: re-run request hooks for the retried request
-                    for req_hook in self._on_request:
-                        try:
-                            await req_hook(req)
-                        except Exception as e:
-                            logger.debug(
-                                "Request hook failed during retry: %s", e, exc_info=True
-                            )
-                            pass
+                    if self._on_request:
+                        await self._run_request_hooks(req, retry=True)
                     continue  # retry now with refreshed auth
 
             # Regular retry policy for 429/5xx (and any configured statuses)
-            should_retry_status = resp.status_code in self.cfg.retry.retry_on_status
+            should_retry_status = resp.status_code in retry_statuses
             if (
                 should_retry_status
-                and attempt <= self.cfg.retry.max_attempts
+                and attempt <= max_attempts
                 and _can_retry(method, req)
             ):
                 ra = _parse_retry_after(resp.headers.get("retry-after"))
-                delay = (
-                    ra
-                    if ra is not None
-                    else _full_jitter(
-                        self.cfg.retry.base_backoff_s, attempt, self.cfg.retry.max_cap_s
-                    )
-                )
-                # Small +/-10% wiggle around server hint to avoid alignment
                 if ra is not None:
-                    wiggle = ra * 0.1
-                    delay = max(0.0, _rng.uniform(max(0.0, ra - wiggle), ra + wiggle))
-                await asyncio.sleep(delay)
+                    # Small +/-10% wiggle around server hint to avoid alignment
+                    delay = max(0.0, ra * (0.9 + 0.2 * _rand()))
+                else:
+                    delay = _full_jitter(base_backoff_s, attempt, max_cap_s)
+                await self._sleep(delay)
                 attempt += 1
-                req = build()
+                if reuse_request:
+                    req.extensions["attempt"] = attempt
+                else:
+                    req = build()
                 if auth:
                     await auth.authorize(req)
                 # Optional: re-run request hooks for the retried request
-                for req_hook in self._on_request:
-                    try:
-                        await req_hook(req)
-                    except Exception as e:
-                        logger.debug(
-                            "Request hook failed during retry: %s", e, exc_info=True
-                        )
-                        pass
+                if self._on_request:
+                    await self._run_request_hooks(req, retry=True)
                 continue
 
             # Done (either success or non-retryable error)
@@ -206,8 +312,24 @@ class AsyncTransport:
         """
         if resp.status_code < 400:
             return
+        rid = resp.headers.get("x-request-id")
+        ct = resp.headers.get("content-type", "")
+        # Forwarded raw; APIError only parses it if retry_after_s is read.
+        ra_raw = resp.headers.get("retry-after")
+        if not resp.content or not ct.startswith("application/json"):
+            # Empty or non-JSON body: skip the doomed JSON parse entirely.
+            raise APIError(
+                resp.status_code,
+                "api_error",
+                resp.text,
+                None,
+                rid,
+                None,
+                resp.content,
+                retry_after_raw=ra_raw,
+            )
         try:
-            body = resp.json()
+            body = _loads(resp.content)
             err = body.get("error", {})
         except Exception:
             raise APIError(
@@ -215,17 +337,33 @@ class AsyncTransport:
                 "api_error",
                 resp.text,
                 None,
-                resp.headers.get("x-request-id"),
+                rid,
                 None,
                 resp.content,
+                retry_after_raw=ra_raw,
             ) from None
         typ = err.get("type") or "api_error"
         msg = err.get("message") or resp.text
         code = err.get("code")
-        rid = resp.headers.get("x-request-id")
         ra = err.get("retry_after")
         if resp.status_code == 429:
             raise RateLimitError(
-                resp.status_code, typ, msg, code, rid, ra, resp.content
+                resp.status_code,
+                typ,
+                msg,
+                code,
+                rid,
+                ra,
+                resp.content,
+                retry_after_raw=ra_raw,
             )
-        raise APIError(resp.status_code, typ, msg, code, rid, ra, resp.content)
+        raise APIError(
+            resp.status_code,
+            typ,
+            msg,
+            code,
+            rid,
+            ra,
+            resp.content,
+            retry_after_raw=ra_raw,
+        )
@@ -0,0 +1,187 @@
+"""Shared fixtures for the test suite."""
+
+import copy
+import logging
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from urllib.parse import parse_qsl
+
+import httpx
+import pytest
+import respx
+
+from gavaconnect.auth import BearerAuthPolicy, ClientCredentialsProvider
+
+try:  # orjson encodes mock payloads faster when installed
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def jresp(status: int, body: dict) -> httpx.Response:
+    """Build a JSON response without httpx's stdlib encoding path."""
+    return httpx.Response(status, content=_dumps(body), headers=_JSON_HEADERS)
+
+
+@lru_cache(maxsize=64)
+def _parse_form(content: bytes) -> dict[str, str]:
+    """Decode a urlencoded body once per distinct captured payload."""
+    return dict(parse_qsl(content.decode()))
+
+
+@lru_cache(maxsize=64)
+def _request_template(method: str, url: str) -> httpx.Request:
+    """Cache one immutable request skeleton per (method, url) pair."""
+    return httpx.Request(method, url)
+
+
+@pytest.fixture(scope="session")
+def make_request() -> Callable[..., httpx.Request]:
+    """Build requests by shallow-copying a cached template.
+
+    Each call gets fresh headers and extensions so tests can mutate them
+    (or use the request as a mapping key) without bleeding across tests,
+    while URL parsing happens once per distinct (method, url).
+    """
+
+    def _make(
+        method: str, url: str, headers: dict[str, str] | None = None
+    ) -> httpx.Request:
+        req = copy.copy(_request_template(method, url))
+        req.headers = httpx.Headers(headers)
+        req.extensions = {}
+        return req
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_response() -> Callable[..., httpx.Response]:
+    """Build plain responses without per-test constructor boilerplate."""
+
+    def _make(
+        status: int,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+    ) -> httpx.Response:
+        return httpx.Response(status, headers=headers, content=content)
+
+    return _make
+
+
+@pytest.fixture
+def gava_caplog(caplog: pytest.LogCaptureFixture) -> Iterator[pytest.LogCaptureFixture]:
+    """Capture the gavaconnect logger at DEBUG for the whole test."""
+    with caplog.at_level(logging.DEBUG, logger="gavaconnect"):
+        yield caplog
+
+
+@pytest.fixture
+def form() -> Callable[[httpx.Request], dict[str, str]]:
+    """Parse a captured request's form body, cached per body bytes."""
+
+    def _form(request: httpx.Request) -> dict[str, str]:
+        return _parse_form(request.content)
+
+    return _form
+
+
+@pytest.fixture(scope="module")
+def _respx_mock() -> Iterator[respx.MockRouter]:
+    """Start one respx router per module instead of one per test."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def respx_router(_respx_mock: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """Function-scoped view of the module router, cleaned between tests."""
+    yield _respx_mock
+    _respx_mock.clear()
+    _respx_mock.reset()
+
+
+@pytest.fixture
+def auth_mock(respx_router: respx.MockRouter) -> Callable[..., respx.Route]:
+    """Pre-register the token endpoint and return a response setter.
+
+    The route is compiled once on the shared router; tests only swap the
+    mocked response instead of re-declaring URL and matcher every time.
+    """
+    route = respx_router.post("https://auth.example.com/token")
+
+    def _set(json_body: dict, status: int = 200) -> respx.Route:
+        route.mock(return_value=jresp(status, json_body))
+        return route
+
+    return _set
+
+
+@pytest.fixture
+def make_provider() -> Callable[..., ClientCredentialsProvider]:
+    """Build a ClientCredentialsProvider without per-test boilerplate.
+
+    Providers share the module-level pooled token client, so construction
+    is plain object allocation; the factory exists to keep test bodies to
+    the arguments that actually vary.
+    """
+
+    def factory(
+        token_url: str,
+        client_id: str,
+        client_secret: str,
+        scope: str | None = None,
+    ) -> ClientCredentialsProvider:
+        return ClientCredentialsProvider(
+            token_url, client_id, client_secret, scope=scope
+        )
+
+    return factory
+
+
+@pytest.fixture
+def provider_with_fetch() -> Callable[..., ClientCredentialsProvider]:
+    """Build a provider whose _fetch is replaced by a supplied coroutine.
+
+    Collapses the recurring "stub the network fetch" boilerplate; extra
+    keyword arguments (clock, early_refresh_s, ...) pass straight through
+    to the constructor.
+    """
+
+    def _factory(fetch_coro: Callable, **kwargs: object) -> ClientCredentialsProvider:
+        provider = ClientCredentialsProvider(
+            token_url="https://auth.example.com/token",
+            client_id="test_client",
+            client_secret="test_secret",
+            **kwargs,
+        )
+        provider._fetch = fetch_coro
+        return provider
+
+    return _factory
+
+
+@pytest.fixture
+def make_policy(
+    make_provider: Callable[..., ClientCredentialsProvider],
+) -> Callable[..., tuple[ClientCredentialsProvider, BearerAuthPolicy]]:
+    """Build a provider plus the BearerAuthPolicy wrapping it."""
+
+    def factory(
+        token_url: str,
+        client_id: str,
+        client_secret: str,
+        scope: str | None = None,
+    ) -> tuple[ClientCredentialsProvider, BearerAuthPolicy]:
+        provider = make_provider(token_url, client_id, client_secret, scope=scope)
+        return provider, BearerAuthPolicy(provider)
+
+    return factory
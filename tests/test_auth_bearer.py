@@ -1,216 +1,285 @@
 """Tests for bearer authentication module."""
 
+import asyncio
+import copy
+import json
+from collections.abc import Callable, Iterator
 from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
 import respx
 
-from gavaconnect.auth.bearer import BearerAuthPolicy
+from gavaconnect.auth.bearer import BearerAuthPolicy, TokenProvider
 from gavaconnect.auth.providers import ClientCredentialsProvider
 
+# Signature of the make_policy conftest fixture's factory.
+_MakePolicy = Callable[..., tuple[ClientCredentialsProvider, BearerAuthPolicy]]
 
-class MockTokenProvider:
-    """Mock token provider for testing."""
+# Parsed once at import; fresh_request copies it instead of re-parsing the
+# URL for every request the unit tests build.
+_REQUEST_TEMPLATE = httpx.Request("GET", "https://example.com")
 
-    def __init__(
-        self, token: str = "test_token", refresh_token: str = "new_token"
-    ) -> None:
-        """Initialize the mock token provider.
 
-        Args:
-            token: The initial token to return.
-            refresh_token: The token to return after refresh.
+try:  # orjson encodes mock payloads faster when installed
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
 
-        """
-        self.token = token
-        self.refresh_token = refresh_token
-        self.get_token_calls = 0
-        self.refresh_calls = 0
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
 
-    async def get_token(self) -> str:
-        """Mock get_token method."""
-        self.get_token_calls += 1
-        return self.token
 
-    async def refresh(self) -> str:
-        """Mock refresh method."""
-        self.refresh_calls += 1
-        self.token = self.refresh_token
-        return self.refresh_token
+# Token-endpoint bodies serialized once at import; tests reuse the bytes
+# instead of paying a dumps call per mocked response.
+_JSON_HEADERS = {"content-type": "application/json"}
+_INTEGRATION_TOKEN_BODY = _dumps(
+    {
+        "access_token": "real_integration_token",
+        "expires_in": 3600,
+        "token_type": "Bearer",
+    }
+)
+_DEDUPED_TOKEN_BODY = _dumps({"access_token": "deduped_token", "expires_in": 3600})
+_CACHED_TOKEN_BODY = _dumps({"access_token": "cached_token", "expires_in": 3600})
+_OAUTH_ERROR_BODY = _dumps(
+    {
+        "error": "invalid_client",
+        "error_description": "Client authentication failed",
+    }
+)
 
 
-class TestBearerAuthPolicy:
-    """Test BearerAuthPolicy class."""
+@pytest.fixture
+def fresh_request() -> Callable[..., httpx.Request]:
+    """Build GET requests against example.com from the parsed template."""
 
-    def test_init(self):
-        """Test BearerAuthPolicy initialization."""
-        provider = MockTokenProvider()
-        policy = BearerAuthPolicy(provider)
+    def _factory(path: str = "") -> httpx.Request:
+        req = copy.copy(_REQUEST_TEMPLATE)
+        req.headers = httpx.Headers()
+        if path:
+            req.url = _REQUEST_TEMPLATE.url.copy_with(path=path)
+        return req
+
+    return _factory
 
-        assert policy._p is provider
-        assert policy._last == ""
-
-    @pytest.mark.asyncio
-    async def test_authorize(self):
-        """Test authorization of a request."""
-        provider = MockTokenProvider(token="test_access_token")
-        policy = BearerAuthPolicy(provider)
-
-        request = httpx.Request("GET", "https://example.com")
-        await policy.authorize(request)
-
-        assert request.headers["authorization"] == "Bearer test_access_token"
-        assert policy._last == "test_access_token"
-        assert provider.get_token_calls == 1
-
-    @pytest.mark.asyncio
-    async def test_authorize_multiple_calls(self):
-        """Test multiple authorization calls."""
-        provider = MockTokenProvider(token="token123")
-        policy = BearerAuthPolicy(provider)
-
-        request1 = httpx.Request("GET", "https://example.com/1")
-        request2 = httpx.Request("GET", "https://example.com/2")
-
-        await policy.authorize(request1)
-        await policy.authorize(request2)
-
-        assert request1.headers["authorization"] == "Bearer token123"
-        assert request2.headers["authorization"] == "Bearer token123"
-        assert provider.get_token_calls == 2
-
-    @pytest.mark.asyncio
-    async def test_on_unauthorized_token_changed(self):
-        """Test unauthorized handling when token changes."""
-        provider = MockTokenProvider(token="old_token", refresh_token="new_token")
-        policy = BearerAuthPolicy(provider)
-
-        # Set initial token
-        policy._last = "old_token"
-
-        result = await policy.on_unauthorized()
-
-        assert result is True  # Token changed
-        assert policy._last == "new_token"
-        assert provider.refresh_calls == 1
-
-    @pytest.mark.asyncio
-    async def test_on_unauthorized_token_unchanged(self):
-        """Test unauthorized handling when token doesn't change."""
-        provider = MockTokenProvider(token="same_token", refresh_token="same_token")
-        policy = BearerAuthPolicy(provider)
-
-        # Set initial token to same as refresh token
-        policy._last = "same_token"
-
-        result = await policy.on_unauthorized()
-
-        assert result is False  # Token didn't change
-        assert policy._last == "same_token"
-        assert provider.refresh_calls == 1
-
-    @pytest.mark.asyncio
-    async def test_on_unauthorized_empty_last_token(self):
-        """Test unauthorized handling with empty last token."""
-        provider = MockTokenProvider(refresh_token="new_token")
-        policy = BearerAuthPolicy(provider)
-
-        # _last starts as empty string
-        result = await policy.on_unauthorized()
-
-        assert result is True  # Empty string != "new_token"
-        assert policy._last == "new_token"
-
-    @pytest.mark.asyncio
-    async def test_full_flow(self):
-        """Test complete authorization and refresh flow."""
-        provider = MockTokenProvider(
-            token="initial_token", refresh_token="refreshed_token"
-        )
-        policy = BearerAuthPolicy(provider)
-
-        # Initial authorization
-        request = httpx.Request("GET", "https://example.com")
-        await policy.authorize(request)
-        assert request.headers["authorization"] == "Bearer initial_token"
-
-        # Unauthorized response triggers refresh
-        changed = await policy.on_unauthorized()
-        assert changed is True
-        assert policy._last == "refreshed_token"
-
-        # New authorization uses refreshed token
-        request2 = httpx.Request("GET", "https://example.com/2")
-        await policy.authorize(request2)
-        assert request2.headers["authorization"] == "Bearer refreshed_token"
-
-
-class TestTokenProviderProtocol:
-    """Test TokenProvider protocol compliance."""
-
-    @pytest.mark.asyncio
-    async def test_mock_provider_compliance(self):
-        """Test that mock provider implements the protocol correctly."""
-        provider = MockTokenProvider()
-
-        # Should have async get_token and refresh methods
-        token = await provider.get_token()
-        assert isinstance(token, str)
-
-        refresh_token = await provider.refresh()
-        assert isinstance(refresh_token, str)
-
-    @pytest.mark.asyncio
-    async def test_provider_with_async_mock(self):
-        """Test using AsyncMock for token provider."""
-        provider = Mock()
-        provider.get_token = AsyncMock(return_value="mocked_token")
-        provider.refresh = AsyncMock(return_value="mocked_refresh")
-
-        policy = BearerAuthPolicy(provider)
-
-        request = httpx.Request("GET", "https://example.com")
-        await policy.authorize(request)
-
-        assert request.headers["authorization"] == "Bearer mocked_token"
-        provider.get_token.assert_called_once()
-
-        result = await policy.on_unauthorized()
-        assert result is True  # "" != "mocked_refresh"
-        provider.refresh.assert_called_once()
 
+@pytest.fixture
+def spec_mock_provider() -> Mock:
+    """TokenProvider stub bound to the protocol spec.
 
+    The spec catches attribute typos at lookup time instead of silently
+    auto-creating child mocks.
+    """
+    provider = Mock(spec=TokenProvider)
+    provider.get_token = AsyncMock(return_value="mocked_token")
+    provider.refresh = AsyncMock(return_value="mocked_refresh")
+    provider.is_expired = Mock(return_value=False)  # use the get_token path
+    return provider
+
+
+@pytest.fixture
+def mock_provider() -> Mock:
+    """AsyncMock-backed TokenProvider stub.
+
+    One Mock per test beats redefining a provider class per module: call
+    counts come for free and return values are set inline where they vary.
+    """
+    provider = Mock()
+    provider.get_token = AsyncMock(return_value="test_token")
+    provider.refresh = AsyncMock(return_value="new_token")
+    provider.is_expired = Mock(return_value=False)
+    return provider
+
+
+def test_init(mock_provider: Mock):
+    """Test BearerAuthPolicy initialization."""
+    policy = BearerAuthPolicy(mock_provider)
+
+    assert policy._p is mock_provider
+    assert policy._last == ""
+
+
+@pytest.mark.asyncio
+async def test_authorize(
+    mock_provider: Mock, fresh_request: Callable[..., httpx.Request]
+):
+    """Test authorization of a request."""
+    mock_provider.get_token.return_value = "test_access_token"
+    policy = BearerAuthPolicy(mock_provider)
+
+    request = fresh_request()
+    await policy.authorize(request)
+
+    assert request.headers["authorization"] == "Bearer test_access_token"
+    assert policy._last == "test_access_token"
+    assert mock_provider.get_token.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_authorize_multiple_calls(
+    mock_provider: Mock, fresh_request: Callable[..., httpx.Request]
+):
+    """Test multiple authorization calls."""
+    mock_provider.get_token.return_value = "token123"
+    policy = BearerAuthPolicy(mock_provider)
+
+    request1 = fresh_request("/1")
+    request2 = fresh_request("/2")
+
+    await policy.authorize(request1)
+    await policy.authorize(request2)
+
+    assert request1.headers["authorization"] == "Bearer token123"
+    assert request2.headers["authorization"] == "Bearer token123"
+    assert mock_provider.get_token.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_authorize_refreshes_past_expiry(
+    mock_provider: Mock, fresh_request: Callable[..., httpx.Request]
+):
+    """Test proactive refresh when the provider reports an expired token."""
+    mock_provider.get_token.return_value = "stale_token"
+    mock_provider.refresh.return_value = "fresh_token"
+    mock_provider.is_expired = Mock(return_value=True)  # provider-clock expiry
+    policy = BearerAuthPolicy(mock_provider)
+
+    request = fresh_request()
+    await policy.authorize(request)
+
+    assert request.headers["authorization"] == "Bearer fresh_token"
+    assert mock_provider.refresh.call_count == 1
+    assert mock_provider.get_token.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_authorize_inplace_uses_cached_header(
+    mock_provider: Mock, fresh_request: Callable[..., httpx.Request]
+):
+    """Test that authorize_inplace restamps without a provider call."""
+    policy = BearerAuthPolicy(mock_provider)
+    await policy.on_unauthorized()
+
+    request = fresh_request()
+    policy.authorize_inplace(request)
+
+    assert request.headers["authorization"] == "Bearer new_token"
+    assert mock_provider.get_token.call_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("last", "refreshed", "expected"),
+    [
+        ("old_token", "new_token", True),  # token changed
+        ("same_token", "same_token", False),  # token unchanged
+        ("", "new_token", True),  # empty initial token counts as changed
+    ],
+)
+async def test_on_unauthorized(
+    mock_provider: Mock, last: str, refreshed: str, expected: bool
+):
+    """Test unauthorized handling across token-change scenarios."""
+    mock_provider.refresh.return_value = refreshed
+    policy = BearerAuthPolicy(mock_provider)
+    policy._last = last
+
+    result = await policy.on_unauthorized()
+
+    assert result is expected
+    assert policy._last == refreshed
+    assert mock_provider.refresh.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_full_flow(
+    mock_provider: Mock, fresh_request: Callable[..., httpx.Request]
+):
+    """Test complete authorization and refresh flow."""
+    mock_provider.get_token.return_value = "initial_token"
+    mock_provider.refresh.return_value = "refreshed_token"
+    policy = BearerAuthPolicy(mock_provider)
+
+    # Initial authorization, then a 401-triggered refresh, then re-auth
+    request = fresh_request()
+    await policy.authorize(request)
+    changed = await policy.on_unauthorized()
+    mock_provider.get_token.return_value = "refreshed_token"
+    request2 = fresh_request("/2")
+    await policy.authorize(request2)
+
+    assert (
+        request.headers["authorization"],
+        changed,
+        policy._last,
+        request2.headers["authorization"],
+    ) == ("Bearer initial_token", True, "refreshed_token", "Bearer refreshed_token")
+
+
+@pytest.mark.asyncio
+async def test_provider_with_async_mock(
+    fresh_request: Callable[..., httpx.Request],
+    spec_mock_provider: Mock,
+):
+    """Test using a spec-bound AsyncMock for token provider."""
+    provider = spec_mock_provider
+    policy = BearerAuthPolicy(provider)
+
+    request = fresh_request()
+    await policy.authorize(request)
+
+    assert request.headers["authorization"] == "Bearer mocked_token"
+    provider.get_token.assert_called_once()
+
+    result = await policy.on_unauthorized()
+    assert result is True  # "" != "mocked_refresh"
+    provider.refresh.assert_called_once()
+
+
+@pytest.fixture(scope="class")
+def _token_endpoint_mock() -> Iterator[respx.Route]:
+    """Compile the token-endpoint route matcher once for the class."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router.post("https://auth.example.com/oauth/token")
+
+
+@pytest.fixture
+def token_route(_token_endpoint_mock: respx.Route) -> Iterator[respx.Route]:
+    """Per-test view of the shared token route; call history is reset."""
+    yield _token_endpoint_mock
+    _token_endpoint_mock.reset()
+
+
+@pytest.mark.integration
+@pytest.mark.xdist_group("auth_integration")
 class TestBearerAuthPolicyIntegration:
     """Integration tests for BearerAuthPolicy with real token providers."""
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_integration_with_client_credentials_provider(self):
+    async def test_integration_with_client_credentials_provider(
+        self,
+        token_route: respx.Route,
+        make_policy: _MakePolicy,
+        form: Callable[[httpx.Request], dict[str, str]],
+    ):
         """Test BearerAuthPolicy with ClientCredentialsProvider using real HTTP mocking."""
         # Mock the OAuth2 token endpoint
-        token_route = respx.post("https://auth.example.com/oauth/token").mock(
+        token_route.mock(
             return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "real_integration_token",
-                    "expires_in": 3600,
-                    "token_type": "Bearer",
-                },
+                200, content=_INTEGRATION_TOKEN_BODY, headers=_JSON_HEADERS
             )
         )
 
-        # Create a real ClientCredentialsProvider
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/oauth/token",
-            client_id="integration_client",
-            client_secret="integration_secret",
+        # Create a real provider/policy pair
+        _provider, auth_policy = make_policy(
+            "https://auth.example.com/oauth/token",
+            "integration_client",
+            "integration_secret",
             scope="api:read api:write",
         )
 
-        # Create BearerAuthPolicy with the real provider
-        auth_policy = BearerAuthPolicy(provider)
-
         # Test authorization
         request = httpx.Request("GET", "https://api.example.com/data")
         await auth_policy.authorize(request)
@@ -222,46 +291,49 @@ class TestBearerAuthPolicyIntegration:
         # Verify the OAuth request was made correctly
         oauth_request = token_route.calls[0].request
         assert oauth_request.method == "POST"
-        form_data = dict(httpx.QueryParams(oauth_request.content.decode()))
+        form_data = form(oauth_request)
         assert form_data["grant_type"] == "client_credentials"
         assert form_data["scope"] == "api:read api:write"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_integration_refresh_flow(self):
-        """Test complete refresh flow with real HTTP mocking."""
-        call_count = 0
-
-        def token_response(request: httpx.Request) -> httpx.Response:
-            nonlocal call_count
-            call_count += 1
+    async def test_integration_refresh_flow(self, make_policy: _MakePolicy):
+        """Test complete refresh flow with a stubbed token endpoint."""
+        provider, auth_policy = make_policy(
+            "https://auth.example.com/oauth/token",
+            "refresh_client",
+            "refresh_secret",
+        )
+        # Stub the token client directly; respx's route engine adds nothing
+        # to what the call_count/side_effect pair asserts here. A counter-
+        # driven handler builds each response on demand instead of
+        # materializing both (body encoding included) up front.
+        token_req = httpx.Request("POST", "https://auth.example.com/oauth/token")
+        calls = {"n": 0}
+
+        def _token_response(*args: object, **kwargs: object) -> httpx.Response:
+            calls["n"] += 1
             return httpx.Response(
-                200, json={"access_token": f"token_v{call_count}", "expires_in": 3600}
+                200,
+                content=_dumps(
+                    {"access_token": f"token_v{calls['n']}", "expires_in": 3600}
+                ),
+                headers=_JSON_HEADERS,
+                request=token_req,
             )
 
-        # Mock endpoint that returns different tokens
-        token_route = respx.post("https://auth.example.com/oauth/token").mock(
-            side_effect=token_response
-        )
-
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/oauth/token",
-            client_id="refresh_client",
-            client_secret="refresh_secret",
-        )
-
-        auth_policy = BearerAuthPolicy(provider)
+        send = AsyncMock(side_effect=_token_response)
+        provider._client = Mock(send=send)
 
         # First authorization
         request1 = httpx.Request("GET", "https://api.example.com/resource1")
         await auth_policy.authorize(request1)
         assert request1.headers["authorization"] == "Bearer token_v1"
-        assert token_route.call_count == 1
+        assert send.call_count == 1
 
         # Simulate unauthorized response and refresh
         changed = await auth_policy.on_unauthorized()
         assert changed is True  # Token should have changed
-        assert token_route.call_count == 2
+        assert send.call_count == 2
 
         # New authorization should use refreshed token (cached)
         request2 = httpx.Request("GET", "https://api.example.com/resource2")
@@ -270,31 +342,26 @@ class TestBearerAuthPolicyIntegration:
             request2.headers["authorization"] == "Bearer token_v2"
         )  # Uses cached refreshed token
         # Should still be 2 calls since token is cached
-        assert token_route.call_count == 2
+        assert send.call_count == 2
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_integration_error_handling(self):
+    async def test_integration_error_handling(
+        self, token_route: respx.Route, make_policy: _MakePolicy
+    ):
         """Test error handling in integration scenario."""
         # Mock OAuth endpoint that returns an error
-        respx.post("https://auth.example.com/oauth/token").mock(
+        token_route.mock(
             return_value=httpx.Response(
-                401,
-                json={
-                    "error": "invalid_client",
-                    "error_description": "Client authentication failed",
-                },
+                401, content=_OAUTH_ERROR_BODY, headers=_JSON_HEADERS
             )
         )
 
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/oauth/token",
-            client_id="invalid_client",
-            client_secret="invalid_secret",
+        _provider, auth_policy = make_policy(
+            "https://auth.example.com/oauth/token",
+            "invalid_client",
+            "invalid_secret",
         )
 
-        auth_policy = BearerAuthPolicy(provider)
-
         # Authorization should fail with HTTP error
         request = httpx.Request("GET", "https://api.example.com/protected")
 
@@ -303,23 +370,24 @@ class TestBearerAuthPolicyIntegration:
 
         assert exc_info.value.response.status_code == 401
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_integration_caching_behavior(self):
+    async def test_integration_caching_behavior(self, make_policy: _MakePolicy):
         """Test that token caching works correctly in integration."""
-        token_route = respx.post("https://auth.example.com/oauth/token").mock(
+        provider, auth_policy = make_policy(
+            "https://auth.example.com/oauth/token",
+            "cache_client",
+            "cache_secret",
+        )
+        token_req = httpx.Request("POST", "https://auth.example.com/oauth/token")
+        send = AsyncMock(
             return_value=httpx.Response(
-                200, json={"access_token": "cached_token", "expires_in": 3600}
+                200,
+                content=_CACHED_TOKEN_BODY,
+                headers=_JSON_HEADERS,
+                request=token_req,
             )
         )
-
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/oauth/token",
-            client_id="cache_client",
-            client_secret="cache_secret",
-        )
-
-        auth_policy = BearerAuthPolicy(provider)
+        provider._client = Mock(send=send)
 
         # Multiple authorizations should use cached token
         for i in range(3):
@@ -328,4 +396,38 @@ class TestBearerAuthPolicyIntegration:
             assert request.headers["authorization"] == "Bearer cached_token"
 
         # Only first call should hit the token endpoint (due to caching)
+        assert send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_on_unauthorized_dedupes_concurrent(
+        self, token_route: respx.Route, make_policy: _MakePolicy
+    ):
+        """Test that concurrent 401 refreshes collapse into one token fetch."""
+        release = asyncio.Event()
+
+        async def gated_response(request: httpx.Request) -> httpx.Response:
+            # Hold the fetch open so all 50 callers queue behind it; an
+            # event gate replaces the old 10ms wall-clock sleep.
+            await release.wait()
+            return httpx.Response(
+                200, content=_DEDUPED_TOKEN_BODY, headers=_JSON_HEADERS
+            )
+
+        token_route.mock(side_effect=gated_response)
+
+        _provider, auth_policy = make_policy(
+            "https://auth.example.com/oauth/token",
+            "dedupe_client",
+            "dedupe_secret",
+        )
+
+        tasks = [asyncio.create_task(auth_policy.on_unauthorized()) for _ in range(50)]
+        await asyncio.sleep(0)  # let every caller reach the refresh gate
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # The provider coalesces in-flight refreshes, so a thundering herd
+        # of unauthorized responses costs exactly one token request.
         assert token_route.call_count == 1
+        assert any(results)  # the token changed from the initial empty state
+        assert auth_policy._last == "deduped_token"
@@ -1,13 +1,27 @@
 """Tests for token provider implementations."""
 
 import asyncio
-from unittest.mock import patch
+import base64
+from collections.abc import Callable
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
 import respx
 
-from gavaconnect.auth.providers import ClientCredentialsProvider
+from gavaconnect.auth.providers import (
+    _PROVIDER_CACHE,
+    ClientCredentialsProvider,
+    shared_client_credentials_provider,
+)
+
+EXPECTED_BASIC_AUTH_TEST_CLIENT = "Basic " + base64.b64encode(
+    b"test_client:test_secret"
+).decode("ascii")
+
+# Canonical token payload, built once; tests that care about a distinct
+# token or TTL still pass their own dict inline.
+TOKEN_JSON = {"access_token": "test_token", "expires_in": 3600}
 
 
 class TestClientCredentialsProvider:
@@ -27,6 +41,13 @@ class TestClientCredentialsProvider:
         assert provider._scope is None
         assert provider._early == 60
         assert isinstance(provider._client, httpx.AsyncClient)
+        # Providers without an injected client share the pooled module client
+        other = ClientCredentialsProvider(
+            token_url="https://other.example.com/token",
+            client_id="other_client",
+            client_secret="other_secret",
+        )
+        assert provider._client is other._client
         assert isinstance(provider._lock, asyncio.Lock)
         assert provider._token == ""
         assert provider._exp == 0.0
@@ -47,25 +68,44 @@ class TestClientCredentialsProvider:
         assert provider._early == 120
         assert provider._client is custom_client
 
-    @respx.mock
+    def test_is_expired_uses_injected_clock(self):
+        """Test that expiry is judged on the provider's own clock."""
+        provider = ClientCredentialsProvider(
+            token_url="https://auth.example.com/token",
+            client_id="test_client",
+            client_secret="test_secret",
+            clock=lambda: 1000.0,
+        )
+
+        # No token yet: not "expired", get_token fetches anyway.
+        assert not provider.is_expired()
+
+        provider._token = "cached_token"
+        provider._exp = 1500.0
+        assert not provider.is_expired()
+
+        provider._exp = 900.0
+        assert provider.is_expired()
+
     @pytest.mark.asyncio
-    async def test_fetch_success_without_scope(self):
+    async def test_fetch_success_without_scope(
+        self,
+        auth_mock: Callable[..., respx.Route],
+        form: Callable[[httpx.Request], dict[str, str]],
+    ):
         """Test successful token fetch without scope."""
-        # Mock the token endpoint
-        token_route = respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200, json={"access_token": "test_access_token", "expires_in": 3600}
-            )
+        token_route = auth_mock(
+            {"access_token": "test_access_token", "expires_in": 3600}
         )
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
             client_id="test_client",
             client_secret="test_secret",
+            clock=lambda: 1000.0,
         )
 
-        with patch("time.time", return_value=1000.0):
-            token, exp_time = await provider._fetch()
+        token, exp_time = await provider._fetch()
 
         assert token == "test_access_token"
         assert exp_time == 1000.0 + max(30.0, 3600 - 60)  # 4540.0
@@ -77,19 +117,18 @@ class TestClientCredentialsProvider:
         assert request.url == "https://auth.example.com/token"
 
         # Check the form data
-        form_data = dict(httpx.QueryParams(request.content.decode()))
+        form_data = form(request)
         assert form_data["grant_type"] == "client_credentials"
         assert "scope" not in form_data
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_success_with_scope(self):
+    async def test_fetch_success_with_scope(
+        self,
+        auth_mock: Callable[..., respx.Route],
+        form: Callable[[httpx.Request], dict[str, str]],
+    ):
         """Test successful token fetch with scope."""
-        token_route = respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200, json={"access_token": "scoped_token", "expires_in": 7200}
-            )
-        )
+        token_route = auth_mock({"access_token": "scoped_token", "expires_in": 7200})
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
@@ -103,70 +142,53 @@ class TestClientCredentialsProvider:
         # Verify scope was included in request
         assert token_route.called
         request = token_route.calls[0].request
-        form_data = dict(httpx.QueryParams(request.content.decode()))
+        form_data = form(request)
         assert form_data["grant_type"] == "client_credentials"
         assert form_data["scope"] == "read write admin"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_with_custom_expires_in(self):
+    async def test_fetch_with_custom_expires_in(
+        self, auth_mock: Callable[..., respx.Route]
+    ):
         """Test fetch with custom expires_in value."""
-        respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "short_lived_token",
-                    "expires_in": 300,  # 5 minutes
-                },
-            )
-        )
+        auth_mock({"access_token": "short_lived_token", "expires_in": 300})
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
             client_id="test_client",
             client_secret="test_secret",
             early_refresh_s=60,
+            clock=lambda: 2000.0,
         )
 
-        with patch("time.time", return_value=2000.0):
-            token, exp_time = await provider._fetch()
+        token, exp_time = await provider._fetch()
 
         # Should use max(30.0, 300 - 60) = 240
         assert exp_time == 2000.0 + 240.0
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_without_expires_in(self):
+    async def test_fetch_without_expires_in(
+        self, auth_mock: Callable[..., respx.Route]
+    ):
         """Test fetch when response doesn't include expires_in."""
-        respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "default_ttl_token"
-                    # No expires_in field
-                },
-            )
-        )
+        auth_mock({"access_token": "default_ttl_token"})  # No expires_in field
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
             client_id="test_client",
             client_secret="test_secret",
+            clock=lambda: 3000.0,
         )
 
-        with patch("time.time", return_value=3000.0):
-            token, exp_time = await provider._fetch()
+        token, exp_time = await provider._fetch()
 
         # Should use default 3600 seconds: max(30.0, 3600 - 60) = 3540
         assert exp_time == 3000.0 + 3540.0
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_http_error(self):
+    async def test_fetch_http_error(self, auth_mock: Callable[..., respx.Route]):
         """Test fetch when HTTP request fails."""
-        respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(401, json={"error": "invalid_client"})
-        )
+        auth_mock({"error": "invalid_client"}, status=401)
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
@@ -178,40 +200,27 @@ class TestClientCredentialsProvider:
             await provider._fetch()
 
     @pytest.mark.asyncio
-    async def test_get_token_first_call(self):
+    async def test_get_token_first_call(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
         """Test get_token on first call (no cached token)."""
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/token",
-            client_id="test_client",
-            client_secret="test_secret",
-        )
 
-        # Mock the _fetch method directly for this test
         async def mock_fetch() -> tuple[str, float]:
             return "fresh_token", 5000.0
 
-        provider._fetch = mock_fetch
+        provider = provider_with_fetch(mock_fetch, clock=lambda: 1000.0)
 
-        with patch("time.time", return_value=1000.0):
-            token = await provider.get_token()
+        token = await provider.get_token()
 
         assert token == "fresh_token"
         assert provider._token == "fresh_token"
         assert provider._exp == 5000.0
 
     @pytest.mark.asyncio
-    async def test_get_token_cached_valid(self):
+    async def test_get_token_cached_valid(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
         """Test get_token with valid cached token."""
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/token",
-            client_id="test_client",
-            client_secret="test_secret",
-        )
-
-        # Set up cached token
-        provider._token = "cached_token"
-        provider._exp = 5000.0
-
         # Mock _fetch to track if it's called
         fetch_called = False
 
@@ -220,27 +229,47 @@ class TestClientCredentialsProvider:
             fetch_called = True
             return "new_token", 8000.0
 
-        provider._fetch = mock_fetch
+        provider = provider_with_fetch(mock_fetch, clock=lambda: 4000.0)
+        # Set up cached token, well outside the stale window
+        provider._token = "cached_token"
+        provider._exp = 5000.0
+        provider._stale_at = 4820.0
 
-        with patch("time.time", return_value=4000.0):  # Before expiry
-            token = await provider.get_token()
+        token = await provider.get_token()
 
         assert token == "cached_token"
         assert not fetch_called
 
     @pytest.mark.asyncio
-    async def test_get_token_cached_expired(self):
-        """Test get_token with expired cached token."""
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/token",
-            client_id="test_client",
-            client_secret="test_secret",
-        )
+    async def test_get_token_stale_background_refresh(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
+        """Test that a stale token is served while a background refresh runs."""
 
-        # Set up expired cached token
-        provider._token = "expired_token"
-        provider._exp = 4000.0
+        async def mock_fetch() -> tuple[str, float]:
+            return "new_token", 9000.0
+
+        provider = provider_with_fetch(mock_fetch, clock=lambda: 4900.0)
+        # Cached token inside the stale window (expires in 100s, window 180s)
+        provider._token = "stale_token"
+        provider._exp = 5000.0
+        provider._stale_at = 4820.0
+
+        token = await provider.get_token()
 
+        # Caller gets the still-valid token without blocking
+        assert token == "stale_token"
+        assert provider._refresh_task is not None
+        await provider._refresh_task
+
+        assert provider._token == "new_token"
+        assert provider._exp == 9000.0
+
+    @pytest.mark.asyncio
+    async def test_get_token_cached_expired(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
+        """Test get_token with expired cached token."""
         fetch_called = False
 
         async def mock_fetch() -> tuple[str, float]:
@@ -248,10 +277,12 @@ class TestClientCredentialsProvider:
             fetch_called = True
             return "new_token", 8000.0
 
-        provider._fetch = mock_fetch
+        provider = provider_with_fetch(mock_fetch, clock=lambda: 5000.0)
+        # Set up expired cached token
+        provider._token = "expired_token"
+        provider._exp = 4000.0
 
-        with patch("time.time", return_value=5000.0):  # After expiry
-            token = await provider.get_token()
+        token = await provider.get_token()
 
         assert token == "new_token"
         assert provider._token == "new_token"
@@ -259,18 +290,10 @@ class TestClientCredentialsProvider:
         assert fetch_called
 
     @pytest.mark.asyncio
-    async def test_refresh(self):
+    async def test_refresh(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
         """Test refresh method."""
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/token",
-            client_id="test_client",
-            client_secret="test_secret",
-        )
-
-        # Set up existing token
-        provider._token = "old_token"
-        provider._exp = 5000.0
-
         fetch_called = False
 
         async def mock_fetch() -> tuple[str, float]:
@@ -278,7 +301,10 @@ class TestClientCredentialsProvider:
             fetch_called = True
             return "refreshed_token", 8000.0
 
-        provider._fetch = mock_fetch
+        provider = provider_with_fetch(mock_fetch)
+        # Set up existing token
+        provider._token = "old_token"
+        provider._exp = 5000.0
 
         token = await provider.refresh()
 
@@ -288,44 +314,94 @@ class TestClientCredentialsProvider:
         assert fetch_called
 
     @pytest.mark.asyncio
-    async def test_concurrent_get_token_calls(self):
+    async def test_concurrent_get_token_calls(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
         """Test that concurrent get_token calls are properly synchronized."""
-        provider = ClientCredentialsProvider(
-            token_url="https://auth.example.com/token",
-            client_id="test_client",
-            client_secret="test_secret",
-        )
-
         fetch_call_count = 0
+        release = asyncio.Event()
 
         async def mock_fetch() -> tuple[str, float]:
             nonlocal fetch_call_count
             fetch_call_count += 1
-            await asyncio.sleep(0.1)  # Simulate network delay
+            # Hold the "network call" open until the test releases it, so
+            # all callers queue up deterministically without wall-clock sleeps.
+            await release.wait()
             return f"token_{fetch_call_count}", 8000.0
 
-        provider._fetch = mock_fetch
+        provider = provider_with_fetch(mock_fetch)
 
-        with patch("time.time", return_value=1000.0):
-            # Make multiple concurrent calls
-            tasks = [provider.get_token() for _ in range(5)]
-            tokens = await asyncio.gather(*tasks)
+        # No cached token yet, so every call starts on the refresh path.
+        tasks = [asyncio.create_task(provider.get_token()) for _ in range(5)]
+        await asyncio.sleep(0)  # let every task reach the refresh gate
+        release.set()
+        tokens = await asyncio.gather(*tasks)
 
         # All should get the same token
         assert all(token == "token_1" for token in tokens)
         # _fetch should only be called once due to the lock
         assert fetch_call_count == 1
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_early_refresh_parameter(self):
+    async def test_cancelled_leader_wakes_coalesced_waiters(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
+        """Test that cancelling the refresh leader does not strand waiters."""
+        release = asyncio.Event()
+
+        async def blocked_fetch() -> tuple[str, float]:
+            await release.wait()
+            return "recovered_token", 8000.0
+
+        provider = provider_with_fetch(blocked_fetch)
+
+        leader = asyncio.create_task(provider.get_token())
+        await asyncio.sleep(0)  # leader claims the in-flight slot
+        follower = asyncio.create_task(provider.get_token())
+        await asyncio.sleep(0)  # follower parks on the shared future
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # The follower must be woken with a cancellation, not left hanging.
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(follower, timeout=1)
+
+        # The in-flight slot was released, so a fresh refresh succeeds.
+        release.set()
+        assert await provider.refresh() == "recovered_token"
+
+    @pytest.mark.asyncio
+    async def test_fresh_token_read_skips_inflight_refresh(
+        self, provider_with_fetch: Callable[..., ClientCredentialsProvider]
+    ):
+        """Test that fresh-token reads never wait on an in-flight refresh."""
+        release = asyncio.Event()
+
+        async def blocked_fetch() -> tuple[str, float]:
+            await release.wait()
+            return "forced_token", float("inf")
+
+        provider = provider_with_fetch(blocked_fetch)
+        provider._token = "cached_token"
+        provider._exp = float("inf")
+        provider._stale_at = float("inf")
+
+        # A forced refresh is parked on the network...
+        refresh_task = asyncio.create_task(provider.refresh())
+        await asyncio.sleep(0)
+
+        # ...but a reader with a fresh cached token returns immediately.
+        token = await asyncio.wait_for(provider.get_token(), timeout=0.1)
+        assert token == "cached_token"
+
+        release.set()
+        assert await refresh_task == "forced_token"
+
+    @pytest.mark.asyncio
+    async def test_early_refresh_parameter(self, auth_mock: Callable[..., respx.Route]):
         """Test that early_refresh_s parameter affects token expiry calculation."""
-        # Mock responses for both providers
-        respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200, json={"access_token": "test_token", "expires_in": 3600}
-            )
-        )
+        auth_mock(TOKEN_JSON)
 
         # Test with different early refresh values
         provider1 = ClientCredentialsProvider(
@@ -333,6 +409,7 @@ class TestClientCredentialsProvider:
             client_id="test_client",
             client_secret="test_secret",
             early_refresh_s=60,
+            clock=lambda: 1000.0,
         )
 
         provider2 = ClientCredentialsProvider(
@@ -340,53 +417,39 @@ class TestClientCredentialsProvider:
             client_id="test_client",
             client_secret="test_secret",
             early_refresh_s=300,
+            clock=lambda: 1000.0,
         )
 
-        with patch("time.time", return_value=1000.0):
-            _, exp1 = await provider1._fetch()
-            _, exp2 = await provider2._fetch()
+        _, exp1 = await provider1._fetch()
+        _, exp2 = await provider2._fetch()
 
         # Provider1: 1000 + max(30, 3600-60) = 1000 + 3540 = 4540
         # Provider2: 1000 + max(30, 3600-300) = 1000 + 3300 = 4300
         assert exp1 == 4540.0
         assert exp2 == 4300.0
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_minimum_ttl_enforcement(self):
+    async def test_minimum_ttl_enforcement(self, auth_mock: Callable[..., respx.Route]):
         """Test that minimum TTL of 30 seconds is enforced."""
-        respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "short_token",
-                    "expires_in": 10,  # Very short expiry
-                },
-            )
-        )
+        auth_mock({"access_token": "short_token", "expires_in": 10})
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
             client_id="test_client",
             client_secret="test_secret",
             early_refresh_s=60,
+            clock=lambda: 2000.0,
         )
 
-        with patch("time.time", return_value=2000.0):
-            _, exp_time = await provider._fetch()
+        _, exp_time = await provider._fetch()
 
         # Should use minimum of 30 seconds: 2000 + max(30, 10-60) = 2000 + 30 = 2030
         assert exp_time == 2030.0
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_authentication_headers(self):
+    async def test_authentication_headers(self, auth_mock: Callable[..., respx.Route]):
         """Test that authentication headers are sent correctly."""
-        token_route = respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200, json={"access_token": "test_token", "expires_in": 3600}
-            )
-        )
+        token_route = auth_mock(TOKEN_JSON)
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
@@ -402,20 +465,31 @@ class TestClientCredentialsProvider:
         assert "authorization" in request.headers
 
         # Basic auth should be base64 encoded client_id:client_secret
-        import base64
+        assert request.headers["authorization"] == EXPECTED_BASIC_AUTH_TEST_CLIENT
+
+    @pytest.mark.asyncio
+    async def test_auth_header_precomputed_once(
+        self, auth_mock: Callable[..., respx.Route], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that the basic auth header is encoded once at construction."""
+        auth_mock(TOKEN_JSON)
+
+        wrapped = MagicMock(wraps=base64.b64encode)
+        monkeypatch.setattr("gavaconnect.auth.providers.base64.b64encode", wrapped)
+        provider = ClientCredentialsProvider(
+            token_url="https://auth.example.com/token",
+            client_id="test_client",
+            client_secret="test_secret",
+        )
+        await provider._fetch()
+        await provider._fetch()
 
-        expected_auth = base64.b64encode(b"test_client:test_secret").decode()
-        assert request.headers["authorization"] == f"Basic {expected_auth}"
+        assert wrapped.call_count == 1
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_content_type_header(self):
+    async def test_content_type_header(self, auth_mock: Callable[..., respx.Route]):
         """Test that correct content-type header is sent."""
-        token_route = respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200, json={"access_token": "test_token", "expires_in": 3600}
-            )
-        )
+        token_route = auth_mock(TOKEN_JSON)
 
         provider = ClientCredentialsProvider(
             token_url="https://auth.example.com/token",
@@ -429,14 +503,11 @@ class TestClientCredentialsProvider:
         request = token_route.calls[0].request
         assert request.headers["content-type"] == "application/x-www-form-urlencoded"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_full_integration_flow(self):
+    async def test_full_integration_flow(self, auth_mock: Callable[..., respx.Route]):
         """Test complete token lifecycle with real HTTP mocking."""
-        token_route = respx.post("https://auth.example.com/token").mock(
-            return_value=httpx.Response(
-                200, json={"access_token": "integration_token", "expires_in": 3600}
-            )
+        token_route = auth_mock(
+            {"access_token": "integration_token", "expires_in": 3600}
         )
 
         provider = ClientCredentialsProvider(
@@ -444,20 +515,80 @@ class TestClientCredentialsProvider:
             client_id="integration_client",
             client_secret="integration_secret",
             scope="read write",
+            clock=lambda: 1000.0,
+        )
+
+        # First call should fetch token
+        token1 = await provider.get_token()
+        assert token1 == "integration_token"
+        assert token_route.call_count == 1
+
+        # Second call should use cached token
+        token2 = await provider.get_token()
+        assert token2 == "integration_token"
+        assert token_route.call_count == 1  # No additional calls
+
+        # Refresh should force new fetch
+        token3 = await provider.refresh()
+        assert token3 == "integration_token"
+        assert token_route.call_count == 2  # One additional call
+
+
+class TestSharedClientCredentialsProvider:
+    """Test shared_client_credentials_provider caching."""
+
+    def test_same_credentials_share_one_provider(self):
+        """Test that identical credentials return the same provider instance."""
+        _PROVIDER_CACHE.clear()
+        provider1 = shared_client_credentials_provider(
+            token_url="https://auth.example.com/token",
+            client_id="shared_client",
+            client_secret="shared_secret",
+        )
+        provider2 = shared_client_credentials_provider(
+            token_url="https://auth.example.com/token",
+            client_id="shared_client",
+            client_secret="shared_secret",
+        )
+
+        assert provider1 is provider2
+
+    def test_different_credentials_get_distinct_providers(self):
+        """Test that different (token_url, client_id) keys are not shared."""
+        _PROVIDER_CACHE.clear()
+        provider1 = shared_client_credentials_provider(
+            token_url="https://auth.example.com/token",
+            client_id="client_a",
+            client_secret="secret_a",
+        )
+        provider2 = shared_client_credentials_provider(
+            token_url="https://auth.example.com/token",
+            client_id="client_b",
+            client_secret="secret_b",
         )
 
-        with patch("time.time", return_value=1000.0):
-            # First call should fetch token
-            token1 = await provider.get_token()
-            assert token1 == "integration_token"
-            assert token_route.call_count == 1
-
-            # Second call should use cached token
-            token2 = await provider.get_token()
-            assert token2 == "integration_token"
-            assert token_route.call_count == 1  # No additional calls
-
-            # Refresh should force new fetch
-            token3 = await provider.refresh()
-            assert token3 == "integration_token"
-            assert token_route.call_count == 2  # One additional call
+        assert provider1 is not provider2
+
+    def test_rotated_secret_rebuilds_provider(self):
+        """Test that a changed secret replaces the cached provider."""
+        _PROVIDER_CACHE.clear()
+        provider1 = shared_client_credentials_provider(
+            token_url="https://auth.example.com/token",
+            client_id="rotating_client",
+            client_secret="old_secret",
+        )
+        provider2 = shared_client_credentials_provider(
+            token_url="https://auth.example.com/token",
+            client_id="rotating_client",
+            client_secret="new_secret",
+        )
+
+        assert provider1 is not provider2
+        assert provider2._sec == "new_secret"
+        # The rebuilt provider replaces the cache entry and is shared again
+        provider3 = shared_client_credentials_provider(
+            token_url="https://auth.example.com/token",
+            client_id="rotating_client",
+            client_secret="new_secret",
+        )
+        assert provider2 is provider3
@@ -4,6 +4,26 @@ import pytest
 
 from gavaconnect import errors
 
+# Pure-CPU, fixture-free tests: keep them on one xdist worker so parallel
+# runs (pytest -n auto --dist=loadgroup) shard I/O-bound suites elsewhere.
+pytestmark = pytest.mark.xdist_group("errors")
+
+
+class _CustomTransportError(errors.TransportError):
+    """User-defined subclass; must classify like its parent."""
+
+
+API_ERROR_CASES = [
+    (400, "bad_request", "Bad Request"),
+    (401, "unauthorized", "Unauthorized"),
+    (403, "forbidden", "Forbidden"),
+    (404, "not_found", "Not Found"),
+    (422, "unprocessable_entity", "Validation Error"),
+    (500, "internal_error", "Internal Server Error"),
+    (502, "bad_gateway", "Bad Gateway"),
+    (503, "service_unavailable", "Service Unavailable"),
+]
+
 
 class TestSDKError:
     """Tests for the base SDKError exception."""
@@ -142,63 +162,27 @@ class TestAPIError:
         assert error.retry_after_s is None
         assert error.body is None
 
-    def test_api_error_can_be_raised(self) -> None:
-        """Test that APIError can be raised and caught."""
-        with pytest.raises(errors.APIError) as exc_info:
-            raise errors.APIError(
-                status=404,
-                type_="not_found",
-                message="Resource not found",
-                code=None,
-                request_id=None,
-                retry_after_s=None,
-                body=None,
-            )
-
-        error = exc_info.value
-        assert str(error) == "Resource not found"
-        assert error.status == 404
-        assert error.type == "not_found"
+    def test_retry_after_raw_parsed_lazily(self) -> None:
+        """Test that a raw Retry-After value is only parsed on first access."""
+        error = errors.APIError(429, "rate_limit", "Slow down", retry_after_raw="120")
+        assert error._retry_after_s is None
+        assert error.retry_after_s == 120.0
 
-    def test_api_error_caught_as_sdk_error(self) -> None:
-        """Test that APIError can be caught as SDKError."""
-        with pytest.raises(errors.SDKError):
-            raise errors.APIError(
-                status=403,
-                type_="forbidden",
-                message="Access denied",
-                code=None,
-                request_id=None,
-                retry_after_s=None,
-                body=None,
-            )
+        # An explicit pre-parsed value wins over the raw header
+        explicit = errors.APIError(
+            429, "rate_limit", "Slow down", retry_after_s=5.0, retry_after_raw="120"
+        )
+        assert explicit.retry_after_s == 5.0
 
-    def test_api_error_with_different_status_codes(self) -> None:
+    @pytest.mark.parametrize(("status", "type_", "message"), API_ERROR_CASES)
+    def test_api_error_with_different_status_codes(
+        self, status: int, type_: str, message: str
+    ) -> None:
         """Test APIError with various HTTP status codes."""
-        test_cases = [
-            (400, "bad_request", "Bad Request"),
-            (401, "unauthorized", "Unauthorized"),
-            (403, "forbidden", "Forbidden"),
-            (404, "not_found", "Not Found"),
-            (422, "unprocessable_entity", "Validation Error"),
-            (500, "internal_error", "Internal Server Error"),
-            (502, "bad_gateway", "Bad Gateway"),
-            (503, "service_unavailable", "Service Unavailable"),
-        ]
-
-        for status, type_, message in test_cases:
-            error = errors.APIError(
-                status=status,
-                type_=type_,
-                message=message,
-                code=None,
-                request_id=None,
-                retry_after_s=None,
-                body=None,
-            )
-            assert error.status == status
-            assert error.type == type_
-            assert str(error) == message
+        error = errors.APIError(status, type_, message)
+        assert error.status == status
+        assert error.type == type_
+        assert str(error) == message
 
 
 class TestRateLimitError:
@@ -238,10 +222,26 @@ class TestRateLimitError:
         assert error.retry_after_s == retry_after_s
         assert error.body == body
 
-    def test_rate_limit_error_can_be_raised(self) -> None:
-        """Test that RateLimitError can be raised and caught."""
-        with pytest.raises(errors.RateLimitError) as exc_info:
-            raise errors.RateLimitError(
+
+class TestErrorInteractions:
+    """Tests for interactions between different error types."""
+
+    @pytest.mark.parametrize(
+        ("error_cls", "catch_cls"),
+        [
+            (errors.APIError, errors.APIError),
+            (errors.APIError, errors.SDKError),
+            (errors.RateLimitError, errors.RateLimitError),
+            (errors.RateLimitError, errors.APIError),
+            (errors.RateLimitError, errors.SDKError),
+        ],
+    )
+    def test_raise_and_catch(
+        self, error_cls: type[errors.APIError], catch_cls: type[errors.SDKError]
+    ) -> None:
+        """Test each error is caught at every level of its hierarchy."""
+        with pytest.raises(catch_cls) as exc_info:
+            raise error_cls(
                 status=429,
                 type_="rate_limit",
                 message="Too many requests",
@@ -256,47 +256,56 @@ class TestRateLimitError:
         assert error.status == 429
         assert error.retry_after_s == 120.0
 
-    def test_rate_limit_error_caught_as_api_error(self) -> None:
-        """Test that RateLimitError can be caught as APIError."""
-        with pytest.raises(errors.APIError):
-            raise errors.RateLimitError(
-                status=429,
-                type_="rate_limit",
-                message="Rate limited",
-                code=None,
-                request_id=None,
-                retry_after_s=None,
-                body=None,
-            )
-
-    def test_rate_limit_error_caught_as_sdk_error(self) -> None:
-        """Test that RateLimitError can be caught as SDKError."""
-        with pytest.raises(errors.SDKError):
-            raise errors.RateLimitError(
-                status=429,
-                type_="rate_limit",
-                message="Rate limited",
-                code=None,
-                request_id=None,
-                retry_after_s=None,
-                body=None,
-            )
-
-
-class TestErrorInteractions:
-    """Tests for interactions between different error types."""
-
     def test_all_errors_inherit_from_sdk_error(self) -> None:
         """Test that all custom errors inherit from SDKError."""
-        error_classes = [
+        error_classes = {
             errors.TransportError,
             errors.SerializationError,
             errors.APIError,
             errors.RateLimitError,
-        ]
+        }
 
         for error_class in error_classes:
             assert issubclass(error_class, errors.SDKError)
+        assert errors._SDK_ERROR_TYPES.issuperset(error_classes)
+        assert errors._API_ERROR_TYPES == {errors.APIError, errors.RateLimitError}
+
+    @pytest.mark.parametrize(
+        ("exc", "expected"),
+        [
+            (errors.TransportError("conn reset"), True),
+            (
+                errors.RateLimitError(
+                    status=429,
+                    type_="rate_limit",
+                    message="Rate limited",
+                    code=None,
+                    request_id=None,
+                    retry_after_s=1.0,
+                    body=None,
+                ),
+                True,
+            ),
+            (_CustomTransportError("flaky link"), True),
+            (errors.SerializationError("bad payload"), False),
+            (
+                errors.APIError(
+                    status=500,
+                    type_="internal_error",
+                    message="boom",
+                    code=None,
+                    request_id=None,
+                    retry_after_s=None,
+                    body=None,
+                ),
+                False,
+            ),
+            (ValueError("not an SDK error"), False),
+        ],
+    )
+    def test_is_retryable(self, exc: BaseException, expected: bool) -> None:
+        """Test is_retryable classifies transient vs permanent failures."""
+        assert errors.is_retryable(exc) is expected
 
     def test_exception_hierarchy_catch_order(self) -> None:
         """Test that exceptions can be caught in the correct hierarchy order."""
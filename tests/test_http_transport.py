@@ -1,52 +1,107 @@
 """Tests for HTTP transport layer."""
 
-import json
+from collections.abc import Callable
+from dataclasses import replace
+from itertools import cycle
 from typing import Never
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
+import pytest_asyncio
 
-from gavaconnect.auth import AuthPolicy
 from gavaconnect.config import RetryPolicy, SDKConfig
 from gavaconnect.errors import APIError, RateLimitError, TransportError
 from gavaconnect.http.transport import AsyncTransport, _full_jitter
 
+# Built once; SDKConfig is frozen, so tests overlay via dataclasses.replace
+# instead of re-running field validation per construction.
+_DEFAULT_CFG = SDKConfig(
+    base_url="https://api.example.com",
+    connect_timeout_s=5.0,
+    read_timeout_s=30.0,
+    total_timeout_s=40.0,
+)
 
-class TestJitter:
-    """Test the _full_jitter function."""
 
-    def test_jitter_calculation(self):
-        """Test jitter calculation with different inputs."""
-        # Test with base=1.0, attempt=1, cap=10.0
-        result = _full_jitter(1.0, 1, 10.0)
-        # Should be uniform random between 0 and min(cap, base*2^attempt) = min(10, 1*2) = 2
-        assert 0.0 <= result <= 2.0
+class FakeAuth:
+    """Hand-rolled AuthPolicy stub.
+
+    Cheaper than a spec'd Mock, which dir()s the class and builds child
+    mocks on every attribute access. Conforms to the protocol structurally
+    by carrying its own mocks for every hook, including the optional
+    authorize_inplace fast path.
+    """
+
+    def __init__(self, unauth: bool = False) -> None:
+        """Wire up per-instance mocks for every auth hook."""
+        self.authorize = AsyncMock()
+        self.authorize_inplace = Mock()
+        self.on_unauthorized = AsyncMock(return_value=unauth)
+
+
+class FakeResponse:
+    """Bare response stand-in for raise_for_api_error tests.
 
-        # Test with base=0.5, attempt=2, cap=10.0
-        result = _full_jitter(0.5, 2, 10.0)
-        # Should be uniform random between 0 and min(10, 0.5*4) = 2.0
-        assert 0.0 <= result <= 2.0
+    The classifier only reads these four attributes, so a slotted value
+    object replaces per-test Mock() allocation and its lazy child-mock
+    machinery.
+    """
 
-        # Test with base=0.2, attempt=3, cap=1.0
-        result = _full_jitter(0.2, 3, 1.0)
-        # Should be uniform random between 0 and min(1.0, 0.2*8) = 1.0
-        assert 0.0 <= result <= 1.0
+    __slots__ = ("content", "headers", "status_code", "text")
 
-    def test_jitter_randomness(self):
-        """Test that jitter produces different results."""
-        results = [_full_jitter(1.0, 1, 10.0) for _ in range(10)]
-        # Results should not all be the same (very unlikely)
-        assert len(set(results)) > 1
+    def __init__(
+        self,
+        status_code: int,
+        headers: dict[str, str] | None = None,
+        text: str = "",
+        content: bytes = b"",
+    ) -> None:
+        """Store the four attributes the classifier reads."""
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+        self.content = content
+
+
+class TestJitter:
+    """Test the _full_jitter function."""
+
+    @pytest.mark.parametrize(
+        ("base", "attempt", "cap", "upper"),
+        [
+            pytest.param(1.0, 1, 10.0, 2.0, id="base-doubling"),
+            pytest.param(0.5, 2, 10.0, 2.0, id="exponential-growth"),
+            pytest.param(0.2, 3, 1.0, 1.0, id="capped"),
+        ],
+    )
+    def test_jitter_calculation(
+        self, base: float, attempt: int, cap: float, upper: float
+    ):
+        """Test jitter calculation with different inputs."""
+        result = _full_jitter(base, attempt, cap)
+        # Uniform random between 0 and min(cap, base * 2**attempt)
+        assert 0.0 <= result <= upper
+
+    def test_jitter_randomness(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that distinct PRNG draws yield distinct jitter values."""
+        draws = cycle([0.0, 1.0])
+        monkeypatch.setattr(
+            "gavaconnect.helpers.idempotency._rng.uniform",
+            lambda lo, hi: lo + (hi - lo) * next(draws),
+        )
+        # Two calls, deterministic: no chance of a flaky all-equal sample
+        assert _full_jitter(1.0, 1, 10.0) != _full_jitter(1.0, 1, 10.0)
 
 
 class TestAsyncTransport:
     """Test AsyncTransport class."""
 
-    def test_init(self):
-        """Test AsyncTransport initialization."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
+    @pytest.mark.asyncio
+    async def test_init_and_close(self):
+        """Test AsyncTransport initialization and clean shutdown."""
+        config = replace(
+            _DEFAULT_CFG,
             connect_timeout_s=10.0,
             read_timeout_s=60.0,
             total_timeout_s=70.0,
@@ -59,54 +114,39 @@ class TestAsyncTransport:
         assert isinstance(transport.client, httpx.AsyncClient)
         assert str(transport.client.base_url).rstrip("/") == "https://api.example.com"
 
-    @pytest.mark.asyncio
-    async def test_close(self):
-        """Test transport close method."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
-        # Test that close works without error
+        # Close works without error; one private instance covers both
+        # paths instead of two tests each paying construction cost.
         await transport.close()
 
     @pytest.mark.asyncio
-    async def test_successful_request(self):
+    async def test_successful_request(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test successful HTTP request."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
         # Mock the client methods
         mock_request = Mock()
         mock_request.extensions = {}  # Add extensions attribute
         mock_response = Mock()
         mock_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-        ):
-            result = await transport.request("GET", "/test")
+        build_request = Mock(return_value=mock_request)
+        send = AsyncMock(return_value=mock_response)
+        monkeypatch.setattr(transport.client, "build_request", build_request)
+        monkeypatch.setattr(transport.client, "send", send)
 
-            assert result == mock_response
-            transport.client.build_request.assert_called_once_with("GET", "/test")
-            transport.client.send.assert_called_once_with(mock_request, stream=False)
+        result = await transport.request("GET", "/test")
 
-        await transport.close()
+        assert result == mock_response
+        build_request.assert_called_once_with("GET", "/test")
+        send.assert_called_once_with(mock_request, stream=False)
 
     @pytest.mark.asyncio
-    async def test_request_with_auth(self):
+    async def test_request_with_auth(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test request with authentication."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
         # Mock auth policy
-        auth = Mock(spec=AuthPolicy)
-        auth.authorize = AsyncMock()
-        auth.on_unauthorized = AsyncMock(return_value=False)
+        auth = FakeAuth()
 
         # Mock the client methods
         mock_request = Mock()
@@ -114,34 +154,27 @@ class TestAsyncTransport:
         mock_response = Mock()
         mock_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-        ):
-            result = await transport.request(
-                "POST", "/test", auth=auth, json={"data": "test"}
-            )
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(return_value=mock_response)
+        )
 
-            assert result == mock_response
-            auth.authorize.assert_called_once_with(mock_request)
+        result = await transport.request(
+            "POST", "/test", auth=auth, json={"data": "test"}
+        )
 
-        await transport.close()
+        assert result == mock_response
+        auth.authorize.assert_called_once_with(mock_request)
 
     @pytest.mark.asyncio
-    async def test_request_with_401_and_retry(self):
+    async def test_request_with_401_and_retry(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test request handling 401 with auth retry."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
         # Mock auth policy
-        auth = Mock(spec=AuthPolicy)
-        auth.authorize = AsyncMock()
-        auth.on_unauthorized = AsyncMock(return_value=True)  # Retry auth
+        auth = FakeAuth(unauth=True)  # Retry auth
 
         # Mock responses: first 401, then 200
         mock_request = Mock()
@@ -151,290 +184,282 @@ class TestAsyncTransport:
         mock_response_200 = Mock()
         mock_response_200.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[mock_response_401, mock_response_200],
-            ),
-        ):
-            result = await transport.request("GET", "/test", auth=auth)
-
-            assert result == mock_response_200
-            # Auth should be called twice (initial and retry)
-            assert auth.authorize.call_count == 2
-            auth.on_unauthorized.assert_called_once()
+        # Plain coroutine instead of AsyncMock machinery; nothing here
+        # asserts on the send call itself, only on the auth policy.
+        responses = iter([mock_response_401, mock_response_200])
 
-        await transport.close()
+        async def fake_send(req: Mock, stream: bool = False) -> Mock:
+            return next(responses)
 
-    @pytest.mark.asyncio
-    async def test_request_with_http_error_retry(self):
-        """Test request retry on HTTP errors."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
-            retry=RetryPolicy(
-                max_attempts=2, base_backoff_s=0.01
-            ),  # Fast retry for testing
+        monkeypatch.setattr(transport.client, "send", fake_send)
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
         )
-        transport = AsyncTransport(config)
-
-        mock_request = Mock()
-        mock_request.extensions = {}  # Add extensions attribute
-        http_error = httpx.ConnectError("Connection failed")
-        mock_response = Mock()
-        mock_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[http_error, mock_response],
+        result = await transport.request("GET", "/test", auth=auth)
+
+        assert result == mock_response_200
+        # Initial send authorizes; the retry restamps the header in place
+        assert auth.authorize.call_count == 1
+        auth.authorize_inplace.assert_called_once_with(mock_request)
+        auth.on_unauthorized.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("retry_kwargs", "sends", "sleep_range", "expect_raise"),
+        [
+            pytest.param(
+                {"max_attempts": 2, "base_backoff_s": 0.01},
+                [httpx.ConnectError("Connection failed"), 200],
+                None,
+                False,
+                id="network-error-then-success",
             ),
-            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
-        ):
-            result = await transport.request("GET", "/test")
-
-            assert result == mock_response
-            mock_sleep.assert_called_once()  # Should have slept once for retry
-
-        await transport.close()
-
-    @pytest.mark.asyncio
-    async def test_request_max_retries_exceeded(self):
-        """Test request fails after max retries."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
-            retry=RetryPolicy(max_attempts=2, base_backoff_s=0.01),
-        )
-        transport = AsyncTransport(config)
-
-        mock_request = Mock()
-        mock_request.extensions = {}  # Add extensions attribute
-        http_error = httpx.ConnectError("Connection failed")
-
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client, "send", new_callable=AsyncMock, side_effect=http_error
+            pytest.param(
+                {"max_attempts": 2, "base_backoff_s": 0.01},
+                httpx.ConnectError("Connection failed"),
+                None,
+                True,
+                id="network-error-exhausted",
             ),
-            pytest.raises(TransportError, match="Connection failed"),
-        ):
-            await transport.request("GET", "/test")
-
-        await transport.close()
-
-    @pytest.mark.asyncio
-    async def test_request_with_status_code_retry(self):
-        """Test request retry on specific status codes."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
-            retry=RetryPolicy(
-                max_attempts=2, base_backoff_s=0.01, retry_on_status=(503,)
+            pytest.param(
+                {"max_attempts": 2, "base_backoff_s": 0.01, "retry_on_status": (503,)},
+                [(503, {}), 200],
+                None,
+                False,
+                id="status-code-retry",
             ),
-        )
-        transport = AsyncTransport(config)
-
-        mock_request = Mock()
-        mock_request.extensions = {}  # Add extensions attribute
-        mock_response_503 = Mock()
-        mock_response_503.status_code = 503
-        mock_response_503.headers = {}
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
-
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[mock_response_503, mock_response_200],
+            pytest.param(
+                {"max_attempts": 2, "retry_on_status": (429,)},
+                [(429, {"retry-after": "2"}), 200],
+                (1.8, 2.2),  # 2.0 ± 10% wiggle
+                False,
+                id="retry-after-hint",
             ),
-            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
-        ):
-            result = await transport.request("GET", "/test")
-
-            assert result == mock_response_200
-            mock_sleep.assert_called_once()
-
-        await transport.close()
-
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_request_with_retry_after_header(self):
-        """Test request respects retry-after header."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
-            retry=RetryPolicy(max_attempts=2, retry_on_status=(429,)),
-        )
-        transport = AsyncTransport(config)
+    async def test_request_retry_paths(
+        self,
+        transport: AsyncTransport,
+        set_retry: Callable[..., AsyncTransport],
+        mock_sleep: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+        retry_kwargs: dict[str, object],
+        sends: list | Exception,
+        sleep_range: tuple[float, float] | None,
+        expect_raise: bool,
+    ):
+        """Test retry across network errors, status retries and Retry-After.
+
+        One parametrized table replaces four near-identical tests whose
+        only differences were the send side effects and the expected
+        sleep argument.
+        """
+        set_retry(**retry_kwargs)
 
         mock_request = Mock()
         mock_request.extensions = {}  # Add extensions attribute
-        mock_response_429 = Mock()
-        mock_response_429.status_code = 429
-        mock_response_429.headers = {"retry-after": "2"}
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[mock_response_429, mock_response_200],
-            ),
-            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
-        ):
-            result = await transport.request("GET", "/test")
+        def _resp(spec: int | tuple[int, dict[str, str]]) -> Mock:
+            status, headers = spec if isinstance(spec, tuple) else (spec, {})
+            resp = Mock()
+            resp.status_code = status
+            resp.headers = headers
+            return resp
+
+        if not isinstance(sends, list):
+            # A lone exception repeats until the attempts run out
+            # (max_attempts retries on top of the initial send)
+            sends = [sends] * (retry_kwargs["max_attempts"] + 1)
+        outcomes = iter(
+            [item if isinstance(item, Exception) else _resp(item) for item in sends]
+        )
 
-            assert result == mock_response_200
-            # Check that sleep was called once with a value close to 2.0 (±10% jitter)
-            mock_sleep.assert_called_once()
-            sleep_value = mock_sleep.call_args[0][0]
-            assert 1.8 <= sleep_value <= 2.2  # 2.0 ± 10%
+        # Plain coroutine instead of AsyncMock machinery; the assertions
+        # below read the sleep stub, never the send call record.
+        async def fake_send(req: Mock, stream: bool = False) -> Mock:
+            item = next(outcomes)
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+        monkeypatch.setattr(transport.client, "send", fake_send)
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
 
-        await transport.close()
+        if expect_raise:
+            with pytest.raises(TransportError, match="Connection failed"):
+                await transport.request("GET", "/test")
+            return
+        result = await transport.request("GET", "/test")
+
+        assert result.status_code == 200
+        mock_sleep.assert_called_once()  # Exactly one backoff before success
+        if sleep_range is not None:
+            lo, hi = sleep_range
+            assert lo <= mock_sleep.call_args[0][0] <= hi
+
+
+# Canned error responses, built once: raise_for_api_error never mutates
+# its argument, so each parametrized case can reuse the same instance.
+_API_ERROR_CASES = [
+    pytest.param(
+        FakeResponse(
+            400,
+            headers={
+                "x-request-id": "req-123",
+                "content-type": "application/json",
+            },
+            content=(
+                b'{"error": {"type": "validation_error",'
+                b' "message": "Invalid input", "code": "INVALID_INPUT"}}'
+            ),
+        ),
+        APIError,
+        {
+            "status": 400,
+            "type": "validation_error",
+            "message": "Invalid input",
+            "code": "INVALID_INPUT",
+            "request_id": "req-123",
+        },
+        id="json-error-body",
+    ),
+    pytest.param(
+        FakeResponse(
+            429,
+            headers={
+                "x-request-id": "req-456",
+                "content-type": "application/json",
+            },
+            content=(
+                b'{"error": {"type": "rate_limit_exceeded",'
+                b' "message": "Too many requests", "retry_after": 30.0}}'
+            ),
+        ),
+        RateLimitError,
+        {
+            "status": 429,
+            "type": "rate_limit_exceeded",
+            "message": "Too many requests",
+            "retry_after_s": 30.0,
+        },
+        id="rate-limit",
+    ),
+    pytest.param(
+        FakeResponse(
+            500,
+            headers={"x-request-id": "req-789"},
+            text="Internal Server Error",
+            content=b"Internal Server Error",
+        ),
+        APIError,
+        {
+            "status": 500,
+            "type": "api_error",
+            "message": "Internal Server Error",
+            "request_id": "req-789",
+        },
+        id="non-json-body",
+    ),
+    pytest.param(
+        FakeResponse(
+            404,
+            text="Not Found",
+            content=b'{"message": "Not found"}',
+        ),
+        APIError,
+        # Falls back to resp.text when the error field is missing
+        {"status": 404, "type": "api_error", "message": "Not Found"},
+        id="missing-error-field",
+    ),
+    pytest.param(
+        FakeResponse(
+            422,
+            text="Unprocessable Entity",
+            content=b'{"error": {}}',
+        ),
+        APIError,
+        {
+            "status": 422,
+            "type": "api_error",
+            "message": "Unprocessable Entity",
+            "code": None,
+            "request_id": None,
+            "retry_after_s": None,
+        },
+        id="empty-error-object",
+    ),
+]
 
 
 class TestRaiseForApiError:
     """Test the raise_for_api_error static method."""
 
-    def test_no_error_for_success_status(self):
+    @pytest.mark.parametrize("status_code", [200, 201, 202, 204])
+    def test_no_error_for_success_status(self, status_code: int):
         """Test no exception for successful status codes."""
-        for status_code in [200, 201, 202, 204]:
-            resp = Mock()
-            resp.status_code = status_code
-
-            # Should not raise any exception
-            AsyncTransport.raise_for_api_error(resp)
-
-    def test_api_error_with_json_response(self):
-        """Test APIError with proper JSON error response."""
-        resp = Mock()
-        resp.status_code = 400
-        resp.json.return_value = {
-            "error": {
-                "type": "validation_error",
-                "message": "Invalid input",
-                "code": "INVALID_INPUT",
-            }
-        }
-        resp.headers = {"x-request-id": "req-123"}
-        resp.content = b'{"error": {"type": "validation_error"}}'
-
-        with pytest.raises(APIError) as exc_info:
+        # Should not raise any exception
+        AsyncTransport.raise_for_api_error(FakeResponse(status_code))
+
+    @pytest.mark.parametrize(("resp", "exc_cls", "expected"), _API_ERROR_CASES)
+    def test_error_classification(
+        self, resp: FakeResponse, exc_cls: type[APIError], expected: dict[str, object]
+    ):
+        """Test each canned response raises the expected error shape."""
+        with pytest.raises(exc_cls) as exc_info:
             AsyncTransport.raise_for_api_error(resp)
 
         error = exc_info.value
-        assert error.status == 400
-        assert error.type == "validation_error"
-        assert str(error) == "Invalid input"  # message is in the exception string
-        assert error.code == "INVALID_INPUT"
-        assert error.request_id == "req-123"
-
-    def test_rate_limit_error(self):
-        """Test RateLimitError for 429 status."""
-        resp = Mock()
-        resp.status_code = 429
-        resp.json.return_value = {
-            "error": {
-                "type": "rate_limit_exceeded",
-                "message": "Too many requests",
-                "retry_after": 30.0,
-            }
-        }
-        resp.headers = {"x-request-id": "req-456"}
-        resp.content = b'{"error": {"type": "rate_limit_exceeded"}}'
-
-        with pytest.raises(RateLimitError) as exc_info:
-            AsyncTransport.raise_for_api_error(resp)
+        for attr, value in expected.items():
+            if attr == "message":
+                assert str(error) == value
+            else:
+                assert getattr(error, attr) == value
 
-        error = exc_info.value
-        assert error.status == 429
-        assert error.type == "rate_limit_exceeded"
-        assert str(error) == "Too many requests"
-        assert error.retry_after_s == 30.0
-
-    def test_api_error_with_invalid_json(self):
-        """Test APIError when response JSON is invalid."""
-        resp = Mock()
-        resp.status_code = 500
-        resp.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        resp.text = "Internal Server Error"
-        resp.headers = {"x-request-id": "req-789"}
-        resp.content = b"Internal Server Error"
-
-        with pytest.raises(APIError) as exc_info:
-            AsyncTransport.raise_for_api_error(resp)
 
-        error = exc_info.value
-        assert error.status == 500
-        assert error.type == "api_error"
-        assert str(error) == "Internal Server Error"
-        assert error.request_id == "req-789"
-
-    def test_api_error_with_missing_error_field(self):
-        """Test APIError when error field is missing from JSON."""
-        resp = Mock()
-        resp.status_code = 404
-        resp.json.return_value = {"message": "Not found"}  # No "error" field
-        resp.text = "Not Found"
-        resp.headers = {}
-        resp.content = b'{"message": "Not found"}'
-
-        with pytest.raises(APIError) as exc_info:
-            AsyncTransport.raise_for_api_error(resp)
+@pytest_asyncio.fixture(scope="module")
+async def transport():
+    """One shared AsyncTransport for the module.
 
-        error = exc_info.value
-        assert error.status == 404
-        assert error.type == "api_error"
-        assert str(error) == "Not Found"  # Falls back to resp.text
-
-    def test_api_error_defaults(self):
-        """Test APIError with minimal error information."""
-        resp = Mock()
-        resp.status_code = 422
-        resp.json.return_value = {"error": {}}  # Empty error object
-        resp.text = "Unprocessable Entity"
-        resp.headers = {}
-        resp.content = b'{"error": {}}'
-
-        with pytest.raises(APIError) as exc_info:
-            AsyncTransport.raise_for_api_error(resp)
+    client.send is always mocked here, so building a fresh
+    httpx.AsyncClient (connection pool, SSL context) per test is pure
+    overhead; the module shares a single instance instead.
+    """
+    transport = AsyncTransport(_DEFAULT_CFG)
+    yield transport
+    await transport.close()
 
-        error = exc_info.value
-        assert error.status == 422
-        assert error.type == "api_error"  # Default type
-        assert str(error) == "Unprocessable Entity"  # Falls back to resp.text
-        assert error.code is None
-        assert error.request_id is None
-        assert error.retry_after_s is None
+
+@pytest.fixture
+def set_retry(transport: AsyncTransport):
+    """Swap the shared transport's retry policy for one test."""
+    original = transport.cfg
+
+    def _set(**kwargs: object) -> AsyncTransport:
+        transport.cfg = replace(original, retry=RetryPolicy(**kwargs))
+        return transport
+
+    yield _set
+    transport.cfg = original
 
 
 @pytest.fixture
-async def transport():
-    """Fixture providing a configured AsyncTransport instance."""
-    config = SDKConfig(
-        base_url="https://api.example.com",
-        connect_timeout_s=5.0,
-        read_timeout_s=30.0,
-        total_timeout_s=40.0,
-    )
-    transport = AsyncTransport(config)
-    yield transport
-    await transport.close()
+def mock_sleep(transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch):
+    """Stub the transport's backoff sleep so retry tests run instantly."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(transport, "_sleep", sleep)
+    return sleep
 
 
 class TestAsyncTransportIntegration:
     """Integration tests for AsyncTransport."""
 
     @pytest.mark.asyncio
-    async def test_complete_request_flow(self, transport: AsyncTransport):
+    async def test_complete_request_flow(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test complete request flow with mocked httpx client."""
         # Mock a complete successful request
         mock_request = Mock()
@@ -442,145 +467,159 @@ class TestAsyncTransportIntegration:
         mock_response = Mock()
         mock_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-        ):
-            result = await transport.request(
-                "POST", "/api/test", json={"test": "data"}, headers={"custom": "header"}
-            )
+        # Spy closure: appending an args tuple is cheaper than Mock's
+        # call recording plus _Call equality in assert_called_once_with.
+        calls = []
+
+        def build_request(*args: object, **kwargs: object) -> Mock:
+            calls.append((args, kwargs))
+            return mock_request
 
-            assert result == mock_response
+        monkeypatch.setattr(transport.client, "build_request", build_request)
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(return_value=mock_response)
+        )
+
+        result = await transport.request(
+            "POST", "/api/test", json={"test": "data"}, headers={"custom": "header"}
+        )
 
-            # Verify build_request was called with correct parameters
-            transport.client.build_request.assert_called_once_with(
-                "POST", "/api/test", json={"test": "data"}, headers={"custom": "header"}
+        assert result == mock_response
+
+        # Verify build_request was called with the pre-encoded JSON body
+        assert calls == [
+            (
+                ("POST", "/api/test"),
+                {
+                    "content": b'{"test":"data"}',
+                    "headers": {
+                        "custom": "header",
+                        "content-type": "application/json",
+                    },
+                },
             )
+        ]
 
     @pytest.mark.asyncio
-    async def test_request_with_keyword_arguments(self, transport: AsyncTransport):
+    async def test_request_with_keyword_arguments(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test that keyword arguments are properly passed through."""
         mock_request = Mock()
         mock_request.extensions = {}  # Add extensions attribute
         mock_response = Mock()
         mock_response.status_code = 201
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-        ):
-            result = await transport.request(
-                "PUT",
-                "/api/update/123",
-                json={"name": "updated"},
-                headers={"authorization": "Bearer token"},
-                params={"version": "v1"},
-                timeout=60.0,
-            )
+        calls = []
+
+        def build_request(*args: object, **kwargs: object) -> Mock:
+            calls.append((args, kwargs))
+            return mock_request
 
-            assert result == mock_response
+        monkeypatch.setattr(transport.client, "build_request", build_request)
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(return_value=mock_response)
+        )
+
+        result = await transport.request(
+            "PUT",
+            "/api/update/123",
+            json={"name": "updated"},
+            headers={"authorization": "Bearer token"},
+            params={"version": "v1"},
+            timeout=60.0,
+        )
 
-            # Verify all kwargs were passed to build_request
-            call_args = transport.client.build_request.call_args
-            assert call_args[0] == ("PUT", "/api/update/123")
-            assert call_args[1]["json"] == {"name": "updated"}
-            assert call_args[1]["headers"]["authorization"] == "Bearer token"
-            assert call_args[1]["params"] == {"version": "v1"}
-            assert call_args[1]["timeout"] == 60.0
+        assert result == mock_response
+
+        # Verify all kwargs were passed to build_request (json pre-encoded)
+        [(args, kwargs)] = calls
+        assert args == ("PUT", "/api/update/123")
+        assert kwargs["content"] == b'{"name":"updated"}'
+        assert kwargs["headers"]["authorization"] == "Bearer token"
+        assert kwargs["headers"]["content-type"] == "application/json"
+        assert kwargs["params"] == {"version": "v1"}
+        assert kwargs["timeout"] == 60.0
 
     @pytest.mark.asyncio
-    async def test_request_hook_exceptions(self):
+    async def test_request_hook_exceptions(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test that request hook exceptions are handled gracefully."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
 
         # Create a failing request hook
         async def failing_hook(req: httpx.Request) -> Never:
             raise Exception("Hook failure")
 
-        # Add the failing hook
-        transport._on_request.append(failing_hook)
+        # Attach the failing hook; monkeypatch restores the shared transport
+        monkeypatch.setattr(transport, "_on_request", [failing_hook])
 
         mock_request = Mock()
         mock_request.extensions = {}
         mock_response = Mock()
         mock_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-            patch("gavaconnect.http.transport.logger") as mock_logger,
-        ):
-            # Request should still succeed despite hook failure
-            result = await transport.request("GET", "/test")
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(return_value=mock_response)
+        )
+        mock_logger = Mock()
+        monkeypatch.setattr("gavaconnect.http.transport.logger", mock_logger)
 
-            assert result == mock_response
-            # Verify that the exception was logged
-            mock_logger.debug.assert_called()
-            assert "Request hook failed" in str(mock_logger.debug.call_args[0][0])
+        # Request should still succeed despite hook failure
+        result = await transport.request("GET", "/test")
 
-        await transport.close()
+        assert result == mock_response
+        # Verify that the exception was logged
+        mock_logger.debug.assert_called()
+        assert "Request hook failed" in str(mock_logger.debug.call_args[0][0])
 
     @pytest.mark.asyncio
-    async def test_response_hook_exceptions(self):
+    async def test_response_hook_exceptions(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test that response hook exceptions are handled gracefully."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
 
         # Create a failing response hook
         async def failing_hook(req: httpx.Request, resp: httpx.Response) -> Never:
             raise Exception("Response hook failure")
 
-        # Add the failing hook
-        transport._on_response.append(failing_hook)
+        # Attach the failing hook; monkeypatch restores the shared transport
+        monkeypatch.setattr(transport, "_on_response", [failing_hook])
 
         mock_request = Mock()
         mock_request.extensions = {}
         mock_response = Mock()
         mock_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-            patch("gavaconnect.http.transport.logger") as mock_logger,
-        ):
-            # Request should still succeed despite hook failure
-            result = await transport.request("GET", "/test")
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(return_value=mock_response)
+        )
+        mock_logger = Mock()
+        monkeypatch.setattr("gavaconnect.http.transport.logger", mock_logger)
 
-            assert result == mock_response
-            # Verify that the exception was logged
-            mock_logger.debug.assert_called()
-            assert "Response hook failed" in str(mock_logger.debug.call_args[0][0])
+        # Request should still succeed despite hook failure
+        result = await transport.request("GET", "/test")
 
-        await transport.close()
+        assert result == mock_response
+        # Verify that the exception was logged
+        mock_logger.debug.assert_called()
+        assert "Response hook failed" in str(mock_logger.debug.call_args[0][0])
 
     @pytest.mark.asyncio
-    async def test_network_error_max_retries_exceeded(self):
+    async def test_network_error_max_retries_exceeded(
+        self,
+        transport: AsyncTransport,
+        set_retry: Callable[..., AsyncTransport],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """Test network error when max retries exceeded."""
-        config = SDKConfig(
-            base_url="https://api.example.com", retry=RetryPolicy(max_attempts=2)
-        )
-        transport = AsyncTransport(config)
+        set_retry(max_attempts=2)
 
         mock_request = Mock()
         mock_request.extensions = {}
@@ -589,26 +628,21 @@ class TestAsyncTransportIntegration:
 
         network_error = httpx.ConnectError("Connection failed")
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=network_error,
-            ),
-            pytest.raises(TransportError, match="Connection failed"),
-        ):
-            await transport.request("GET", "/test")
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(side_effect=network_error)
+        )
 
-        await transport.close()
+        with pytest.raises(TransportError, match="Connection failed"):
+            await transport.request("GET", "/test")
 
     @pytest.mark.asyncio
-    async def test_network_error_non_idempotent_method(self):
+    async def test_network_error_non_idempotent_method(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test network error with non-idempotent method (no retry)."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
         mock_request = Mock()
         mock_request.extensions = {}
         mock_request.method = "POST"
@@ -616,29 +650,23 @@ class TestAsyncTransportIntegration:
 
         network_error = httpx.ConnectError("Connection failed")
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=network_error,
-            ),
-            pytest.raises(TransportError, match="Connection failed"),
-        ):
-            await transport.request("POST", "/test")
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(side_effect=network_error)
+        )
 
-        await transport.close()
+        with pytest.raises(TransportError, match="Connection failed"):
+            await transport.request("POST", "/test")
 
     @pytest.mark.asyncio
-    async def test_auth_refresh_failure(self):
+    async def test_auth_refresh_failure(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test auth refresh failure handling."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
         # Mock auth that fails refresh
-        mock_auth = Mock(spec=AuthPolicy)
-        mock_auth.authorize = AsyncMock()
+        mock_auth = FakeAuth()
         mock_auth.on_unauthorized = AsyncMock(side_effect=Exception("Refresh failed"))
 
         mock_request = Mock()
@@ -646,64 +674,55 @@ class TestAsyncTransportIntegration:
         mock_response = Mock()
         mock_response.status_code = 401
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-        ):
-            result = await transport.request("GET", "/test", auth=mock_auth)
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(return_value=mock_response)
+        )
 
-            # Should return the 401 response since refresh failed
-            assert result == mock_response
-            mock_auth.on_unauthorized.assert_called_once()
+        result = await transport.request("GET", "/test", auth=mock_auth)
 
-        await transport.close()
+        # Should return the 401 response since refresh failed
+        assert result == mock_response
+        mock_auth.on_unauthorized.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_auth_refresh_returns_false(self):
+    async def test_auth_refresh_returns_false(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test auth refresh returning False (no retry)."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
         # Mock auth that returns False for refresh
-        mock_auth = Mock(spec=AuthPolicy)
-        mock_auth.authorize = AsyncMock()
-        mock_auth.on_unauthorized = AsyncMock(return_value=False)
+        mock_auth = FakeAuth()
 
         mock_request = Mock()
         mock_request.extensions = {}
         mock_response = Mock()
         mock_response.status_code = 401
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                return_value=mock_response,
-            ),
-        ):
-            result = await transport.request("GET", "/test", auth=mock_auth)
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client, "send", AsyncMock(return_value=mock_response)
+        )
 
-            # Should return the 401 response since refresh returned False
-            assert result == mock_response
-            mock_auth.on_unauthorized.assert_called_once()
+        result = await transport.request("GET", "/test", auth=mock_auth)
 
-        await transport.close()
+        # Should return the 401 response since refresh returned False
+        assert result == mock_response
+        mock_auth.on_unauthorized.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_request_hook_exception_during_retry(self):
+    async def test_request_hook_exception_during_retry(
+        self,
+        transport: AsyncTransport,
+        set_retry: Callable[..., AsyncTransport],
+        monkeypatch: pytest.MonkeyPatch,
+        mock_sleep: AsyncMock,
+    ):
         """Test request hook exception during retry."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
-            retry=RetryPolicy(max_attempts=2, retry_on_status={500}),
-        )
-        transport = AsyncTransport(config)
+        set_retry(max_attempts=2, retry_on_status={500})
 
         call_count = 0
 
@@ -713,7 +732,7 @@ class TestAsyncTransportIntegration:
             if call_count > 1:  # Fail on retry
                 raise Exception("Hook failure on retry")
 
-        transport._on_request.append(failing_hook_on_retry)
+        monkeypatch.setattr(transport, "_on_request", [failing_hook_on_retry])
 
         mock_request = Mock()
         mock_request.extensions = {}
@@ -729,35 +748,30 @@ class TestAsyncTransportIntegration:
         second_response.status_code = 200
         second_response.headers = {}
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[first_response, second_response],
-            ),
-            patch("gavaconnect.http.transport.logger") as mock_logger,
-            patch("asyncio.sleep", new_callable=AsyncMock),
-        ):
-            result = await transport.request("GET", "/test")
-
-            assert result.status_code == 200
-            # Verify that the retry hook exception was logged
-            mock_logger.debug.assert_called()
-            logged_messages = [call[0][0] for call in mock_logger.debug.call_args_list]
-            assert any(
-                "Request hook failed during retry" in msg for msg in logged_messages
-            )
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client,
+            "send",
+            AsyncMock(side_effect=[first_response, second_response]),
+        )
+        mock_logger = Mock()
+        monkeypatch.setattr("gavaconnect.http.transport.logger", mock_logger)
 
-        await transport.close()
+        result = await transport.request("GET", "/test")
+
+        assert result.status_code == 200
+        # Verify that the retry hook exception was logged
+        mock_logger.debug.assert_called()
+        logged_messages = [call[0][0] for call in mock_logger.debug.call_args_list]
+        assert any("Request hook failed during retry" in msg for msg in logged_messages)
 
     @pytest.mark.asyncio
-    async def test_auth_refresh_request_hook_exception(self):
+    async def test_auth_refresh_request_hook_exception(
+        self, transport: AsyncTransport, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test request hook exception during auth refresh retry."""
-        config = SDKConfig(base_url="https://api.example.com")
-        transport = AsyncTransport(config)
-
         call_count = 0
 
         async def failing_hook_on_auth_retry(req: httpx.Request) -> None:
@@ -766,12 +780,10 @@ class TestAsyncTransportIntegration:
             if call_count > 1:  # Fail on auth retry
                 raise Exception("Hook failure on auth retry")
 
-        transport._on_request.append(failing_hook_on_auth_retry)
+        monkeypatch.setattr(transport, "_on_request", [failing_hook_on_auth_retry])
 
         # Mock auth that successfully refreshes
-        mock_auth = Mock(spec=AuthPolicy)
-        mock_auth.authorize = AsyncMock()
-        mock_auth.on_unauthorized = AsyncMock(return_value=True)
+        mock_auth = FakeAuth(unauth=True)
 
         mock_request = Mock()
         mock_request.extensions = {}
@@ -785,36 +797,35 @@ class TestAsyncTransportIntegration:
         second_response.status_code = 200
         second_response.headers = {}
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[first_response, second_response],
-            ),
-            patch("gavaconnect.http.transport.logger") as mock_logger,
-        ):
-            result = await transport.request("GET", "/test", auth=mock_auth)
-
-            assert result.status_code == 200
-            # Verify that the auth retry hook exception was logged
-            mock_logger.debug.assert_called()
-            logged_messages = [call[0][0] for call in mock_logger.debug.call_args_list]
-            assert any(
-                "Request hook failed during retry" in msg for msg in logged_messages
-            )
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client,
+            "send",
+            AsyncMock(side_effect=[first_response, second_response]),
+        )
+        mock_logger = Mock()
+        monkeypatch.setattr("gavaconnect.http.transport.logger", mock_logger)
 
-        await transport.close()
+        result = await transport.request("GET", "/test", auth=mock_auth)
+
+        assert result.status_code == 200
+        # Verify that the auth retry hook exception was logged
+        mock_logger.debug.assert_called()
+        logged_messages = [call[0][0] for call in mock_logger.debug.call_args_list]
+        assert any("Request hook failed during retry" in msg for msg in logged_messages)
 
     @pytest.mark.asyncio
-    async def test_retry_after_server_hint_with_wiggle(self):
+    async def test_retry_after_server_hint_with_wiggle(
+        self,
+        transport: AsyncTransport,
+        set_retry: Callable[..., AsyncTransport],
+        mock_sleep: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """Test retry with Retry-After header and wiggle factor."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
-            retry=RetryPolicy(max_attempts=2, retry_on_status={429}),
-        )
-        transport = AsyncTransport(config)
+        set_retry(max_attempts=2, retry_on_status={429})
 
         mock_request = Mock()
         mock_request.extensions = {}
@@ -829,43 +840,43 @@ class TestAsyncTransportIntegration:
         second_response = Mock()
         second_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[first_response, second_response],
-            ),
-            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
-            patch("gavaconnect.helpers.idempotency._rng") as mock_rng,
-        ):
-            # Mock the random number generator for wiggle
-            mock_rng.uniform.return_value = 9.5  # 10 - 0.5 wiggle
-
-            result = await transport.request("GET", "/test")
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client,
+            "send",
+            AsyncMock(side_effect=[first_response, second_response]),
+        )
+        # Pin the random number generator draw used for wiggle
+        monkeypatch.setattr(
+            "gavaconnect.helpers.idempotency._rng.uniform",
+            lambda lo, hi: 9.5,  # 10 - 0.5 wiggle
+        )
 
-            assert result == second_response
+        result = await transport.request("GET", "/test")
 
-            # Verify sleep was called with wiggled value
-            mock_sleep.assert_called_once()
-            sleep_duration = mock_sleep.call_args[0][0]
-            # Should be between 9.0 and 11.0 (10 +/- 10%)
-            assert 9.0 <= sleep_duration <= 11.0
+        assert result == second_response
 
-        await transport.close()
+        # Verify sleep was called with wiggled value
+        mock_sleep.assert_called_once()
+        sleep_duration = mock_sleep.call_args[0][0]
+        # Should be between 9.0 and 11.0 (10 +/- 10%)
+        assert 9.0 <= sleep_duration <= 11.0
 
     @pytest.mark.asyncio
-    async def test_network_error_retry_with_auth(self):
+    async def test_network_error_retry_with_auth(
+        self,
+        transport: AsyncTransport,
+        set_retry: Callable[..., AsyncTransport],
+        mock_sleep: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """Test network error retry with auth authorization."""
-        config = SDKConfig(
-            base_url="https://api.example.com", retry=RetryPolicy(max_attempts=2)
-        )
-        transport = AsyncTransport(config)
+        set_retry(max_attempts=2)
 
         # Mock auth
-        mock_auth = Mock(spec=AuthPolicy)
-        mock_auth.authorize = AsyncMock()
+        mock_auth = FakeAuth()
 
         mock_request = Mock()
         mock_request.extensions = {}
@@ -877,36 +888,34 @@ class TestAsyncTransportIntegration:
         success_response = Mock()
         success_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[network_error, success_response],
-            ),
-            patch("asyncio.sleep", new_callable=AsyncMock),
-        ):
-            result = await transport.request("GET", "/test", auth=mock_auth)
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client,
+            "send",
+            AsyncMock(side_effect=[network_error, success_response]),
+        )
 
-            assert result == success_response
-            # Verify auth.authorize was called for both attempts
-            assert mock_auth.authorize.call_count == 2
+        result = await transport.request("GET", "/test", auth=mock_auth)
 
-        await transport.close()
+        assert result == success_response
+        # Verify auth.authorize was called for both attempts
+        assert mock_auth.authorize.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_status_code_retry_with_auth(self):
+    async def test_status_code_retry_with_auth(
+        self,
+        transport: AsyncTransport,
+        set_retry: Callable[..., AsyncTransport],
+        mock_sleep: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
         """Test status code retry with auth authorization."""
-        config = SDKConfig(
-            base_url="https://api.example.com",
-            retry=RetryPolicy(max_attempts=2, retry_on_status={500}),
-        )
-        transport = AsyncTransport(config)
+        set_retry(max_attempts=2, retry_on_status={500})
 
         # Mock auth
-        mock_auth = Mock(spec=AuthPolicy)
-        mock_auth.authorize = AsyncMock()
+        mock_auth = FakeAuth()
 
         mock_request = Mock()
         mock_request.extensions = {}
@@ -921,20 +930,17 @@ class TestAsyncTransportIntegration:
         second_response = Mock()
         second_response.status_code = 200
 
-        with (
-            patch.object(transport.client, "build_request", return_value=mock_request),
-            patch.object(
-                transport.client,
-                "send",
-                new_callable=AsyncMock,
-                side_effect=[first_response, second_response],
-            ),
-            patch("asyncio.sleep", new_callable=AsyncMock),
-        ):
-            result = await transport.request("GET", "/test", auth=mock_auth)
+        monkeypatch.setattr(
+            transport.client, "build_request", Mock(return_value=mock_request)
+        )
+        monkeypatch.setattr(
+            transport.client,
+            "send",
+            AsyncMock(side_effect=[first_response, second_response]),
+        )
 
-            assert result == second_response
-            # Verify auth.authorize was called for both attempts
-            assert mock_auth.authorize.call_count == 2
+        result = await transport.request("GET", "/test", auth=mock_auth)
 
-        await transport.close()
+        assert result == second_response
+        # Verify auth.authorize was called for both attempts
+        assert mock_auth.authorize.call_count == 2
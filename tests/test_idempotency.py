@@ -1,10 +1,13 @@
 """Tests for idempotency helpers."""
 
 import datetime
-import uuid
-from unittest.mock import Mock, patch
+import re
+from collections.abc import Callable
+from itertools import count
+from types import SimpleNamespace
 
 import httpx
+import pytest
 
 from gavaconnect.helpers.idempotency import (
     _can_retry,
@@ -14,10 +17,27 @@ from gavaconnect.helpers.idempotency import (
     idempotency_headers,
 )
 
+# Generated keys are 32 lowercase hex chars (token_hex(16)); a precompiled
+# match is much cheaper than a full uuid.UUID round trip per assertion.
+_HEX_KEY_RE = re.compile(r"^[0-9a-f]{32}$")
+
 
 class TestIdempotencyHeaders:
     """Test idempotency_headers function."""
 
+    @pytest.fixture(autouse=True)
+    def _fake_token_hex(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Back key generation with a counter instead of os.urandom.
+
+        Draws stay unique and 32 hex chars, so format and uniqueness
+        assertions are unaffected while each call skips a syscall.
+        """
+        counter = count()
+        monkeypatch.setattr(
+            "gavaconnect.helpers.idempotency.secrets.token_hex",
+            lambda nbytes=16: f"{next(counter):0{nbytes * 2}x}",
+        )
+
     def test_with_provided_key(self):
         """Test that provided key is used in headers."""
         test_key = "test-key-123"
@@ -33,8 +53,7 @@ class TestIdempotencyHeaders:
 
         assert "idempotency-key" in result
         assert isinstance(result["idempotency-key"], str)
-        # Verify it's a valid UUID format
-        uuid.UUID(result["idempotency-key"])
+        assert _HEX_KEY_RE.match(result["idempotency-key"])
 
     def test_with_no_key_parameter(self):
         """Test that UUID is generated when no key parameter is provided."""
@@ -42,8 +61,7 @@ class TestIdempotencyHeaders:
 
         assert "idempotency-key" in result
         assert isinstance(result["idempotency-key"], str)
-        # Verify it's a valid UUID format
-        uuid.UUID(result["idempotency-key"])
+        assert _HEX_KEY_RE.match(result["idempotency-key"])
 
     def test_empty_string_key(self):
         """Test that empty string key generates UUID."""
@@ -51,8 +69,8 @@ class TestIdempotencyHeaders:
 
         assert "idempotency-key" in result
         assert isinstance(result["idempotency-key"], str)
-        # Verify it's a valid UUID format (empty string is falsy)
-        uuid.UUID(result["idempotency-key"])
+        # Empty string is falsy, so a key is generated
+        assert _HEX_KEY_RE.match(result["idempotency-key"])
 
     def test_whitespace_key(self):
         """Test that whitespace-only key is preserved."""
@@ -61,16 +79,20 @@ class TestIdempotencyHeaders:
 
         assert result == {"idempotency-key": test_key}
 
-    @patch("uuid.uuid4")
-    def test_uuid_generation_called(self, mock_uuid4: Mock) -> None:
-        """Test that uuid.uuid4 is called when no key provided."""
-        mock_uuid = uuid.UUID("12345678-1234-5678-1234-567812345678")
-        mock_uuid4.return_value = mock_uuid
+    def test_key_generation_called(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that secrets.token_hex is called when no key provided."""
+        calls: list[int] = []
+
+        def fake_token_hex(nbytes: int) -> str:
+            calls.append(nbytes)
+            return "12345678123456781234567812345678"
+
+        monkeypatch.setattr("secrets.token_hex", fake_token_hex)
 
         result = idempotency_headers()
 
-        mock_uuid4.assert_called_once()
-        assert result["idempotency-key"] == str(mock_uuid)
+        assert calls == [16]
+        assert result["idempotency-key"] == "12345678123456781234567812345678"
 
     def test_different_calls_generate_different_uuids(self):
         """Test that consecutive calls without keys generate different UUIDs."""
@@ -92,38 +114,56 @@ class TestIdempotencyHeaders:
 class TestFullJitter:
     """Test _full_jitter function."""
 
-    def test_full_jitter_calculation(self):
-        """Test jitter calculation with different inputs."""
-        # Test with base=1.0, attempt=1, cap=10.0
-        result = _full_jitter(1.0, 1, 10.0)
-        # Should be uniform random between 0 and min(cap, base*2^attempt) = min(10, 1*2) = 2
-        assert 0.0 <= result <= 2.0
-
-        # Test with base=0.5, attempt=2, cap=10.0
-        result = _full_jitter(0.5, 2, 10.0)
-        # Should be uniform random between 0 and min(10, 0.5*4) = 2.0
-        assert 0.0 <= result <= 2.0
-
-        # Test with base=0.2, attempt=3, cap=1.0
-        result = _full_jitter(0.2, 3, 1.0)
-        # Should be uniform random between 0 and min(1.0, 0.2*8) = 1.0
-        assert 0.0 <= result <= 1.0
+    @pytest.mark.parametrize(
+        ("base", "attempt", "cap", "upper"),
+        [
+            # Upper bound is min(cap, base * 2**attempt)
+            pytest.param(1.0, 1, 10.0, 2.0, id="base-doubling"),
+            pytest.param(0.5, 2, 10.0, 2.0, id="exponential-growth"),
+            pytest.param(0.2, 3, 1.0, 1.0, id="capped"),
+            pytest.param(2.0, 0, 10.0, 2.0, id="zero-attempt"),
+        ],
+    )
+    def test_full_jitter_bounds(
+        self, base: float, attempt: int, cap: float, upper: float
+    ):
+        """Test that many draws all stay within the full-jitter bounds."""
+        # A single draw barely exercises the bounds; 1000 draws make an
+        # off-by-one in the cap or a negative sample essentially certain
+        # to surface while staying well under a millisecond.
+        draws = [_full_jitter(base, attempt, cap) for _ in range(1000)]
+        assert min(draws) >= 0.0
+        assert max(draws) <= upper
 
     def test_full_jitter_zero_base(self):
         """Test jitter with zero base."""
         result = _full_jitter(0.0, 5, 10.0)
         assert result == 0.0
 
-    def test_full_jitter_zero_attempt(self):
-        """Test jitter with zero attempt."""
-        result = _full_jitter(2.0, 0, 10.0)
-        # Should be uniform random between 0 and min(10, 2*1) = 2
-        assert 0.0 <= result <= 2.0
-
 
 class TestParseRetryAfter:
     """Test _parse_retry_after function."""
 
+    @pytest.fixture
+    def frozen_utc(self, monkeypatch: pytest.MonkeyPatch):
+        """Freeze the module clock used for HTTP-date math.
+
+        Swaps the module's datetime attribute for a tiny namespace rather
+        than a MagicMock'd module; returns a setter to move the frozen
+        "now" when a test needs a different instant.
+        """
+        frozen = {"now": datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)}
+        fake = SimpleNamespace(
+            UTC=datetime.UTC,
+            datetime=SimpleNamespace(now=lambda tz=None: frozen["now"]),
+        )
+        monkeypatch.setattr("gavaconnect.helpers.idempotency.datetime", fake)
+
+        def _set(now: datetime.datetime) -> None:
+            frozen["now"] = now
+
+        return _set
+
     def test_parse_retry_after_none(self):
         """Test parsing None value."""
         result = _parse_retry_after(None)
@@ -158,72 +198,62 @@ class TestParseRetryAfter:
         result = _parse_retry_after("30.5.1")
         assert result is None
 
-    def test_parse_retry_after_http_date(self):
+    def test_parse_retry_after_http_date(
+        self, frozen_utc: Callable[[datetime.datetime], None]
+    ):
         """Test parsing HTTP date format."""
-        # Test with a future date
-        with patch("gavaconnect.helpers.idempotency.datetime") as mock_datetime:
-            # Mock current time
-            mock_now = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
-            mock_datetime.datetime.now.return_value = mock_now
-            mock_datetime.UTC = datetime.UTC
-
-            # Test future date (30 seconds later)
-            result = _parse_retry_after("Sun, 01 Jan 2023 12:00:30 GMT")
-            assert result == 30.0
-
-    def test_parse_retry_after_past_date(self):
+        # Frozen now is 12:00:00; test a date 30 seconds in the future
+        result = _parse_retry_after("Sun, 01 Jan 2023 12:00:30 GMT")
+        assert result == 30.0
+
+    def test_parse_retry_after_past_date(
+        self, frozen_utc: Callable[[datetime.datetime], None]
+    ):
         """Test parsing past HTTP date."""
-        with patch("gavaconnect.helpers.idempotency.datetime") as mock_datetime:
-            # Mock current time
-            mock_now = datetime.datetime(2023, 1, 1, 12, 0, 30, tzinfo=datetime.UTC)
-            mock_datetime.datetime.now.return_value = mock_now
-            mock_datetime.UTC = datetime.UTC
+        frozen_utc(datetime.datetime(2023, 1, 1, 12, 0, 30, tzinfo=datetime.UTC))
 
-            # Test past date (same time but earlier)
-            result = _parse_retry_after("Sun, 01 Jan 2023 12:00:00 GMT")
-            assert result == 0.0
+        # Test past date (same time but earlier)
+        result = _parse_retry_after("Sun, 01 Jan 2023 12:00:00 GMT")
+        assert result == 0.0
 
-    def test_parse_retry_after_exception_handling(self):
+    def test_parse_retry_after_exception_handling(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test exception handling in HTTP date parsing."""
-        with patch(
-            "gavaconnect.helpers.idempotency.parsedate_to_datetime"
-        ) as mock_parse:
-            # Mock an exception during parsing
-            mock_parse.side_effect = Exception("Parsing error")
-
-            result = _parse_retry_after("Some date string")
-            assert result is None
-
-    def test_parse_retry_after_none_datetime(self):
-        """Test when parsedate_to_datetime returns None."""
-        with patch(
-            "gavaconnect.helpers.idempotency.parsedate_to_datetime"
-        ) as mock_parse:
-            # Mock returning None
-            mock_parse.return_value = None
-
-            result = _parse_retry_after("Invalid date format")
-            assert result is None
-
-    def test_parse_retry_after_naive_datetime(self):
-        """Test when parsedate_to_datetime returns a naive datetime (no timezone)."""
-        with (
-            patch(
-                "gavaconnect.helpers.idempotency.parsedate_to_datetime"
-            ) as mock_parse,
-            patch("gavaconnect.helpers.idempotency.datetime") as mock_datetime,
-        ):
-            # Mock a naive datetime (no timezone)
-            naive_dt = datetime.datetime(2023, 1, 1, 12, 0, 30)
-            mock_parse.return_value = naive_dt
-
-            # Mock current time
-            mock_now = datetime.datetime(2023, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
-            mock_datetime.datetime.now.return_value = mock_now
-            mock_datetime.UTC = datetime.UTC
-
-            result = _parse_retry_after("Sun, 01 Jan 2023 12:00:30 GMT")
-            assert result == 30.0
+
+        def raising_parser(value: str) -> None:
+            raise Exception("Parsing error")
+
+        monkeypatch.setattr(
+            "gavaconnect.helpers.idempotency._parsedate", raising_parser
+        )
+
+        result = _parse_retry_after("Some date string")
+        assert result is None
+
+    def test_parse_retry_after_none_datetime(self, monkeypatch: pytest.MonkeyPatch):
+        """Test when the HTTP-date parser returns None."""
+        monkeypatch.setattr(
+            "gavaconnect.helpers.idempotency._parsedate", lambda value: None
+        )
+
+        result = _parse_retry_after("Invalid date format")
+        assert result is None
+
+    def test_parse_retry_after_naive_datetime(
+        self,
+        frozen_utc: Callable[[datetime.datetime], None],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test when the HTTP-date parser returns a naive datetime (no timezone)."""
+        # Naive datetime (no timezone); frozen now is 12:00:00
+        monkeypatch.setattr(
+            "gavaconnect.helpers.idempotency._parsedate",
+            lambda value: datetime.datetime(2023, 1, 1, 12, 0, 30),
+        )
+
+        result = _parse_retry_after("Sun, 01 Jan 2023 12:00:30 GMT")
+        assert result == 30.0
 
     def test_parse_retry_after_invalid_date(self):
         """Test parsing invalid HTTP date."""
@@ -237,92 +267,70 @@ class TestParseRetryAfter:
 class TestIsIdempotent:
     """Test _is_idempotent function."""
 
-    def test_idempotent_methods(self):
-        """Test that idempotent methods are correctly identified."""
-        assert _is_idempotent("GET") is True
-        assert _is_idempotent("HEAD") is True
-        assert _is_idempotent("OPTIONS") is True
-        assert _is_idempotent("DELETE") is True
-
-    def test_non_idempotent_methods(self):
-        """Test that non-idempotent methods are correctly identified."""
-        assert _is_idempotent("POST") is False
-        assert _is_idempotent("PUT") is False
-        assert _is_idempotent("PATCH") is False
-
-    def test_case_insensitive(self):
-        """Test that method comparison is case insensitive."""
-        assert _is_idempotent("get") is True
-        assert _is_idempotent("Get") is True
-        assert _is_idempotent("GET") is True
-        assert _is_idempotent("post") is False
-        assert _is_idempotent("Post") is False
-        assert _is_idempotent("POST") is False
-
-    def test_unknown_methods(self):
-        """Test unknown HTTP methods."""
-        assert _is_idempotent("UNKNOWN") is False
-        assert _is_idempotent("") is False
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            ("GET", True),
+            ("HEAD", True),
+            ("OPTIONS", True),
+            ("DELETE", True),
+            ("POST", False),
+            ("PUT", False),
+            ("PATCH", False),
+            # Case insensitivity
+            ("get", True),
+            ("Get", True),
+            ("post", False),
+            ("Post", False),
+            # Unknown methods
+            ("UNKNOWN", False),
+            ("", False),
+        ],
+    )
+    def test_is_idempotent(self, method: str, expected: bool):
+        """Test idempotency classification across methods and casings."""
+        assert _is_idempotent(method) is expected
+
+
+# _can_retry only reads req.headers (case-insensitively), so a namespace
+# carrying httpx.Headers stands in for a full request with no URL parse.
+_NO_HEADERS_REQ = SimpleNamespace(headers=httpx.Headers())
 
 
 class TestCanRetry:
     """Test _can_retry function."""
 
-    def test_can_retry_idempotent_methods(self):
-        """Test that idempotent methods can be retried."""
-        req = httpx.Request("GET", "https://example.com")
-        assert _can_retry("GET", req) is True
-
-        req = httpx.Request("HEAD", "https://example.com")
-        assert _can_retry("HEAD", req) is True
-
-        req = httpx.Request("OPTIONS", "https://example.com")
-        assert _can_retry("OPTIONS", req) is True
-
-        req = httpx.Request("DELETE", "https://example.com")
-        assert _can_retry("DELETE", req) is True
-
-    def test_can_retry_non_idempotent_without_key(self):
-        """Test that non-idempotent methods without idempotency key cannot be retried."""
-        req = httpx.Request("POST", "https://example.com")
-        assert _can_retry("POST", req) is False
-
-        req = httpx.Request("PUT", "https://example.com")
-        assert _can_retry("PUT", req) is False
-
-        req = httpx.Request("PATCH", "https://example.com")
-        assert _can_retry("PATCH", req) is False
-
-    def test_can_retry_non_idempotent_with_key(self):
-        """Test that non-idempotent methods with idempotency key can be retried."""
-        req = httpx.Request(
-            "POST", "https://example.com", headers={"idempotency-key": "test-key"}
-        )
-        assert _can_retry("POST", req) is True
-
-        req = httpx.Request(
-            "PUT", "https://example.com", headers={"Idempotency-Key": "test-key"}
-        )
-        assert _can_retry("PUT", req) is True
-
-        req = httpx.Request(
-            "PATCH", "https://example.com", headers={"IDEMPOTENCY-KEY": "test-key"}
-        )
-        assert _can_retry("PATCH", req) is True
-
-    def test_can_retry_case_insensitive_header(self):
-        """Test that idempotency key header check is case insensitive."""
-        req = httpx.Request(
-            "POST", "https://example.com", headers={"idempotency-key": "test"}
-        )
-        assert _can_retry("POST", req) is True
-
-        req = httpx.Request(
-            "POST", "https://example.com", headers={"Idempotency-Key": "test"}
-        )
-        assert _can_retry("POST", req) is True
-
-        req = httpx.Request(
-            "POST", "https://example.com", headers={"IDEMPOTENCY-KEY": "test"}
+    @pytest.mark.parametrize(
+        ("method", "headers", "expected"),
+        [
+            pytest.param("GET", None, True, id="get"),
+            pytest.param("HEAD", None, True, id="head"),
+            pytest.param("OPTIONS", None, True, id="options"),
+            pytest.param("DELETE", None, True, id="delete"),
+            pytest.param("POST", None, False, id="post-no-key"),
+            pytest.param("PUT", None, False, id="put-no-key"),
+            pytest.param("PATCH", None, False, id="patch-no-key"),
+            pytest.param("POST", {"idempotency-key": "test-key"}, True, id="post-key"),
+            pytest.param("PUT", {"Idempotency-Key": "test-key"}, True, id="put-key"),
+            pytest.param(
+                "PATCH", {"IDEMPOTENCY-KEY": "test-key"}, True, id="patch-key"
+            ),
+            # Header name casing is normalized by httpx
+            pytest.param(
+                "POST", {"Idempotency-Key": "test"}, True, id="mixed-case-header"
+            ),
+            pytest.param(
+                "POST", {"IDEMPOTENCY-KEY": "test"}, True, id="upper-case-header"
+            ),
+        ],
+    )
+    def test_can_retry(
+        self, method: str, headers: dict[str, str] | None, expected: bool
+    ):
+        """Test retry eligibility by method and idempotency-key header."""
+        req = (
+            _NO_HEADERS_REQ
+            if headers is None
+            else SimpleNamespace(headers=httpx.Headers(headers))
         )
-        assert _can_retry("POST", req) is True
+        assert _can_retry(method, req) is expected
@@ -1,15 +1,27 @@
 """Tests for KRA PIN checker functionality."""
 
+import pytest
+
 from gavaconnect import checkers
 
 
-def test_kra_pin_checker_valid() -> None:
-    """Test that a valid 6-digit PIN is correctly identified."""
-    checker = checkers.KRAPINChecker("123456")
-    assert checker.check_by_id_number() == "Valid KRA PIN."
+@pytest.mark.parametrize(
+    ("pin", "expected"),
+    [
+        pytest.param("123456", "Valid KRA PIN.", id="six-digits"),
+        pytest.param("abc123", "Valid KRA PIN.", id="six-alphanumeric"),
+        pytest.param("12345", "Invalid KRA PIN.", id="too-short"),
+        pytest.param("1234567", "Invalid KRA PIN.", id="too-long"),
+        pytest.param("12 456", "Invalid KRA PIN.", id="non-alphanumeric"),
+        pytest.param("", "Invalid KRA PIN.", id="empty"),
+    ],
+)
+def test_kra_pin_checker(pin: str, expected: str) -> None:
+    """Test single-PIN validation across valid and invalid shapes."""
+    assert checkers.KRAPINChecker(pin).check_by_id_number() == expected
 
 
-def test_kra_pin_checker_invalid() -> None:
-    """Test that an invalid PIN (not 6 digits) is correctly identified."""
-    checker = checkers.KRAPINChecker("12345")
-    assert checker.check_by_id_number() == "Invalid KRA PIN."
+def test_kra_pin_checker_check_many() -> None:
+    """Test that a batch check returns one result per input, in order."""
+    results = checkers.KRAPINChecker.check_many(["123456", "12345", "abc123"])
+    assert results == ["Valid KRA PIN.", "Invalid KRA PIN.", "Valid KRA PIN."]